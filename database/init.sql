@@ -2,6 +2,7 @@
 
 -- Create extensions
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- Supply Chain Events Table
 CREATE TABLE supply_chain_events (
@@ -82,6 +83,7 @@ CREATE INDEX idx_risk_assessments_risk_level ON risk_assessments(risk_level);
 CREATE INDEX idx_alerts_business_profile_id ON alerts(business_profile_id);
 CREATE INDEX idx_alerts_status ON alerts(status);
 CREATE INDEX idx_alerts_created_at ON alerts(created_at);
+CREATE INDEX idx_business_profiles_industry_trgm ON business_profiles USING gin (lower(industry) gin_trgm_ops);
 
 -- Create trigger function for updating timestamps
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -5,14 +5,40 @@ Data validation and quality assurance module for supply chain data
 import re
 import logging
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime
 from dataclasses import dataclass
+import sys
+import time
 import json
 import hashlib
+from itertools import chain
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Single DNS label (RFC 1123), checked per dot-separated part of a URL host
+_LABEL_RE = re.compile(r'^[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?$')
+
+# Structured location formats; canal and port names share a prefix so they are one pattern
+_LOCATION_PATTERNS = (
+    re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'),      # City State
+    re.compile(r'\b[A-Z][a-z]+, [A-Z]{2}\b'),        # City, ST
+    re.compile(r'\b[A-Z][a-z]+ (?:Canal|Port)\b'),   # Canal / Port names
+)
+
+# Text patterns shared by the validators; fuzzy-hash tokens are ASCII-dominated
+_WORD_RE = re.compile(r'\b\w+\b', re.ASCII)
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+
+# Common words ignored when building fuzzy duplicate signatures
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
+    'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'
+})
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of data validation"""
     is_valid: bool
@@ -24,7 +50,9 @@ class ValidationResult:
 class DataQualityValidator:
     """Comprehensive data quality validation"""
     
-    def __init__(self):
+    def __init__(self, full_analysis: bool = False):
+        # When False, events missing required fields are rejected without running the sub-validators
+        self.full_analysis = full_analysis
         self.validation_rules = self._load_validation_rules()
         self.quality_thresholds = {
             "minimum_title_length": 10,
@@ -38,26 +66,21 @@ class DataQualityValidator:
     def _load_validation_rules(self) -> Dict[str, Any]:
         """Load validation rules and patterns"""
         return {
-            "required_fields": ["title", "description", "severity"],
-            "optional_fields": ["location", "impact_sectors", "source", "url"],
+            "required_fields": ("title", "description", "severity"),
+            "optional_fields": ("location", "impact_sectors", "source", "url"),
             "severity_keywords": {
-                "high": ["crisis", "emergency", "critical", "severe", "major", "catastrophic"],
-                "medium": ["disruption", "delay", "shortage", "impact", "concern", "warning"],
-                "low": ["minor", "slight", "limited", "temporary", "brief"]
+                "high": frozenset({"crisis", "emergency", "critical", "severe", "major", "catastrophic"}),
+                "medium": frozenset({"disruption", "delay", "shortage", "impact", "concern", "warning"}),
+                "low": frozenset({"minor", "slight", "limited", "temporary", "brief"})
             },
-            "location_patterns": [
-                r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',  # City State
-                r'\b[A-Z][a-z]+, [A-Z]{2}\b',    # City, ST
-                r'\b[A-Z][a-z]+ Canal\b',        # Canal names
-                r'\b[A-Z][a-z]+ Port\b'          # Port names
-            ],
+            "location_patterns": _LOCATION_PATTERNS,
             "sector_keywords": {
-                "automotive": ["car", "auto", "vehicle", "toyota", "ford", "gm"],
-                "electronics": ["chip", "semiconductor", "electronics", "tech"],
-                "energy": ["oil", "gas", "energy", "power", "electricity"],
-                "transportation": ["shipping", "logistics", "freight", "cargo", "port"],
-                "manufacturing": ["factory", "plant", "production", "manufacturing"],
-                "agriculture": ["food", "farming", "crop", "grain", "livestock"]
+                "automotive": frozenset({"car", "auto", "vehicle", "toyota", "ford", "gm"}),
+                "electronics": frozenset({"chip", "semiconductor", "electronics", "tech"}),
+                "energy": frozenset({"oil", "gas", "energy", "power", "electricity"}),
+                "transportation": frozenset({"shipping", "logistics", "freight", "cargo", "port"}),
+                "manufacturing": frozenset({"factory", "plant", "production", "manufacturing"}),
+                "agriculture": frozenset({"food", "farming", "crop", "grain", "livestock"})
             }
         }
     
@@ -75,6 +98,16 @@ class DataQualityValidator:
             elif not str(event[field]).strip():
                 errors.append(f"Empty required field: {field}")
         
+        # The event can no longer be valid, so skip the detailed analysis
+        if errors and not self.full_analysis:
+            return ValidationResult(
+                is_valid=False,
+                quality_score=0.0,
+                errors=errors,
+                warnings=warnings,
+                metadata=metadata
+            )
+        
         # Title validation
         title = event.get("title", "")
         if title:
@@ -93,10 +126,13 @@ class DataQualityValidator:
             warnings.extend(desc_quality["warnings"])
             metadata["description_analysis"] = desc_quality["metadata"]
         
+        # Combined text used for keyword consistency checks
+        content = f"{title} {description}" if title or description else ""
+        
         # Severity validation
         severity = event.get("severity")
         if severity is not None:
-            severity_quality = self._validate_severity(severity, title + " " + description)
+            severity_quality = self._validate_severity(severity, content)
             quality_score += severity_quality["score"]
             errors.extend(severity_quality["errors"])
             warnings.extend(severity_quality["warnings"])
@@ -113,7 +149,7 @@ class DataQualityValidator:
         # Sectors validation
         sectors = event.get("impact_sectors", [])
         if sectors:
-            sectors_quality = self._validate_sectors(sectors, title + " " + description)
+            sectors_quality = self._validate_sectors(sectors, content)
             quality_score += sectors_quality["score"]
             warnings.extend(sectors_quality["warnings"])
             metadata["sectors_analysis"] = sectors_quality["metadata"]
@@ -158,7 +194,7 @@ class DataQualityValidator:
         # Content quality
         if title.strip():
             # Check for meaningful content (not just special characters)
-            meaningful_chars = len(re.sub(r'[^\w\s]', '', title))
+            meaningful_chars = len(_SPECIAL_CHARS_RE.sub('', title))
             if meaningful_chars / title_len > 0.7:
                 score += 0.1
             else:
@@ -202,11 +238,11 @@ class DataQualityValidator:
         
         # Content quality
         if description.strip():
-            # Sentence structure
-            sentences = description.split('.')
-            metadata["sentence_count"] = len([s for s in sentences if s.strip()])
+            # Sentence structure: non-blank segments between periods, so ellipses count once
+            metadata["sentence_count"] = sum(1 for s in description.split('.') if s.strip())
+            period_count = description.count('.')
             
-            if len(sentences) > 1:
+            if period_count:
                 score += 0.1  # Bonus for multiple sentences
             
             # Information density
@@ -291,7 +327,7 @@ class DataQualityValidator:
             
             # Pattern matching for structured locations
             for pattern in self.validation_rules["location_patterns"]:
-                if re.search(pattern, location_clean):
+                if pattern.search(location_clean):
                     score += 0.1
                     metadata["structured_format"] = True
                     break
@@ -337,7 +373,7 @@ class DataQualityValidator:
                 sector_lower = sector.lower().strip()
                 
                 # Check if sector keywords appear in content
-                sector_keywords = self.validation_rules["sector_keywords"].get(sector_lower, [])
+                sector_keywords = self.validation_rules["sector_keywords"].get(sector_lower, ())
                 if sector_keywords and any(keyword in content_lower for keyword in sector_keywords):
                     consistent_sectors.append(sector)
                     score += 0.05  # Bonus for content-consistent sectors
@@ -360,26 +396,28 @@ class DataQualityValidator:
         warnings = []
         metadata = {}
         
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        
-        if not url_pattern.match(url):
+        try:
+            parts = urlsplit(url)
+            valid_format = (
+                parts.scheme in ('http', 'https')
+                and bool(parts.netloc)
+                and self._is_valid_host(parts.hostname or '')
+                and (parts.port is None or parts.port > 0)  # .port raises ValueError if malformed
+                and not any(ch.isspace() for ch in url)
+            )
+        except ValueError:
+            valid_format = False
+        
+        if not valid_format:
             warnings.append(f"Invalid URL format: {url}")
             metadata["valid_format"] = False
         else:
             metadata["valid_format"] = True
             
             # Check for HTTPS
-            if url.startswith('https://'):
-                metadata["secure"] = True
-            else:
+            metadata["secure"] = parts.scheme == 'https'
+            if not metadata["secure"]:
                 warnings.append("URL uses HTTP instead of HTTPS")
-                metadata["secure"] = False
         
         return {
             "score": 0.0,  # URL doesn't contribute to quality score
@@ -387,6 +425,27 @@ class DataQualityValidator:
             "warnings": warnings,
             "metadata": metadata
         }
+    
+    def _is_valid_host(self, host: str) -> bool:
+        """Check a URL host is localhost, a dotted IPv4 address or a domain name"""
+        if host == 'localhost':
+            return True
+        
+        labels = host.rstrip('.').split('.')
+        
+        # Dotted IPv4 address
+        if len(labels) == 4 and all(label.isdigit() and len(label) <= 3 for label in labels):
+            return True
+        
+        # Domain name with an alphabetic TLD
+        tld = labels[-1]
+        return (
+            len(labels) > 1
+            and 2 <= len(tld) <= 6
+            and tld.isascii()
+            and tld.isalpha()
+            and all(_LABEL_RE.match(label) for label in labels[:-1])
+        )
 
 class DuplicateDetector:
     """Advanced duplicate detection system"""
@@ -417,7 +476,7 @@ class DuplicateDetector:
         
         # Store hashes for future comparison
         event_metadata = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": time.time(),  # Epoch seconds; only ever compared numerically
             "title": event.get("title", "")[:50],  # Store first 50 chars
             "source": event.get("source", "unknown")
         }
@@ -436,39 +495,43 @@ class DuplicateDetector:
     def _generate_content_hash(self, event: Dict[str, Any]) -> str:
         """Generate hash for content-based duplicate detection"""
         # Normalize content by removing extra spaces and converting to lowercase
-        title = re.sub(r'\s+', ' ', event.get('title', '').lower().strip())
-        description = re.sub(r'\s+', ' ', event.get('description', '').lower().strip())
+        title = _WHITESPACE_RE.sub(' ', event.get('title', '').lower().strip())
+        description = _WHITESPACE_RE.sub(' ', event.get('description', '').lower().strip())
         content = f"{title}{description}"
         return hashlib.md5(content.encode()).hexdigest()
     
     def _generate_fuzzy_hash(self, event: Dict[str, Any]) -> str:
         """Generate hash for fuzzy duplicate detection"""
-        # Extract key terms and create a simplified signature
-        title = event.get('title', '').lower()
-        description = event.get('description', '').lower()
-        
-        # Extract meaningful words (remove common words)
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'}
-        
-        all_words = re.findall(r'\b\w+\b', title + ' ' + description)
-        meaningful_words = [word for word in all_words if len(word) > 3 and word not in stop_words]
+        # Extract key terms and create a simplified signature from the first
+        # meaningful words, stopping the scan as soon as enough are found
+        meaningful_words = []
+        tokens = chain(
+            _WORD_RE.finditer(event.get('title', '').lower()),
+            _WORD_RE.finditer(event.get('description', '').lower())
+        )
+        for match in tokens:
+            word = match.group()
+            if len(word) > 3 and word not in _STOP_WORDS:
+                meaningful_words.append(word)
+                if len(meaningful_words) == 10:  # Use top 10 meaningful words
+                    break
         
-        # Sort and join to create signature
-        signature = ' '.join(sorted(meaningful_words[:10]))  # Use top 10 meaningful words
-        return hashlib.md5(signature.encode()).hexdigest()
+        # Sort and feed the words straight into the hasher to create the signature
+        signature = hashlib.blake2b(digest_size=16)
+        for word in sorted(meaningful_words):
+            signature.update(word.encode())
+            signature.update(b' ')
+        return signature.hexdigest()
     
     def cleanup_old_entries(self, max_age_hours: int = 24):
         """Clean up old entries to prevent memory bloat"""
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
+        cutoff_time = time.time() - max_age_hours * 3600
         
         to_remove = []
         for hash_key, metadata in self.processed_events.items():
-            try:
-                event_time = datetime.fromisoformat(metadata["timestamp"])
-                if event_time < cutoff_time:
-                    to_remove.append(hash_key)
-            except (ValueError, KeyError):
-                # Remove entries with invalid timestamps
+            event_time = metadata.get("timestamp")
+            # Remove entries with missing or invalid timestamps as well as expired ones
+            if not isinstance(event_time, float) or event_time < cutoff_time:
                 to_remove.append(hash_key)
         
         for hash_key in to_remove:
@@ -480,8 +543,9 @@ class DataNormalizer:
     """Data normalization and standardization"""
     
     def __init__(self):
-        self.location_aliases = self._load_location_aliases()
-        self.sector_mappings = self._load_sector_mappings()
+        # Canonical names are interned so the many events sharing them reference one string
+        self.location_aliases = {k: sys.intern(v) for k, v in self._load_location_aliases().items()}
+        self.sector_mappings = {k: sys.intern(v) for k, v in self._load_sector_mappings().items()}
     
     def _load_location_aliases(self) -> Dict[str, str]:
         """Load location aliases for standardization"""
@@ -529,28 +593,30 @@ class DataNormalizer:
     
     def normalize_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize event data"""
-        normalized_event = event.copy()
+        normalized_fields = {}
         
         # Normalize location
         location = event.get("location", "")
         if location:
-            normalized_event["location"] = self._normalize_location(location)
+            normalized_fields["location"] = self._normalize_location(location)
         
         # Normalize sectors
         sectors = event.get("impact_sectors", [])
         if sectors:
-            normalized_event["impact_sectors"] = self._normalize_sectors(sectors)
+            normalized_fields["impact_sectors"] = self._normalize_sectors(sectors)
         
         # Normalize text fields
-        for field in ["title", "description"]:
-            if field in normalized_event:
-                normalized_event[field] = self._normalize_text(normalized_event[field])
+        for field in ("title", "description"):
+            if field in event:
+                normalized_fields[field] = self._normalize_text(event[field])
         
-        # Add normalization metadata
-        normalized_event["normalization_applied"] = True
-        normalized_event["normalized_at"] = datetime.utcnow().isoformat()
-        
-        return normalized_event
+        # Merge once over the original event, adding normalization metadata
+        return {
+            **event,
+            **normalized_fields,
+            "normalization_applied": True,
+            "normalized_at": datetime.utcnow().isoformat()
+        }
     
     def _normalize_location(self, location: str) -> str:
         """Normalize location string"""
@@ -564,7 +630,7 @@ class DataNormalizer:
         location_clean = location.strip()
         
         # Capitalize properly
-        return ' '.join(word.capitalize() for word in location_clean.split())
+        return sys.intern(' '.join(word.capitalize() for word in location_clean.split()))
     
     def _normalize_sectors(self, sectors: List[str]) -> List[str]:
         """Normalize sector names"""
@@ -580,8 +646,9 @@ class DataNormalizer:
                     normalized.append(normalized_sector)
             else:
                 # Keep original if no mapping found
-                if sector.lower() not in normalized:
-                    normalized.append(sector.lower())
+                normalized_sector = sys.intern(sector.lower())
+                if normalized_sector not in normalized:
+                    normalized.append(normalized_sector)
         
         return normalized
     
@@ -591,13 +658,13 @@ class DataNormalizer:
             return ""
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WHITESPACE_RE.sub(' ', text.strip())
         
         # Fix common encoding issues
         text = text.replace('"', '"').replace('"', '"')
         text = text.replace(''', "'").replace(''', "'")
         
         # Remove control characters
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        text = _CONTROL_CHARS_RE.sub('', text)
         
         return text
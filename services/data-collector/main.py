@@ -2,16 +2,23 @@
 Data Collection Service - Enhanced with real-world data sources and processing pipeline
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import asyncio
 import logging
 import json
+import orjson
 import os
 import hashlib
 import re
+import uuid
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -20,9 +27,9 @@ from apscheduler.triggers.cron import CronTrigger
 # Import shared modules
 import sys
 sys.path.append('/app/shared')
-from database import get_db, SupplyChainEvent
+from database import SessionLocal, SupplyChainEvent
 from redis_client import RedisClient
-from message_queue import MessageQueue, EventType
+from message_queue import MessageQueue, EventTypes, Exchanges
 
 # Import data sources
 from data_sources import DataSourceOrchestrator
@@ -30,7 +37,7 @@ from data_sources import DataSourceOrchestrator
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Data Collection Service", version="1.0.0")
+app = FastAPI(title="Data Collection Service", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -41,21 +48,102 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize clients
-redis_client = RedisClient()
-message_queue = MessageQueue()
+# Initialize clients; Redis and RabbitMQ connect in startup_event so importing
+# the module does not block on the network
+redis_client: Optional[RedisClient] = None
+message_queue: Optional[MessageQueue] = None
 data_orchestrator = DataSourceOrchestrator()
 
 # Initialize scheduler
 scheduler = AsyncIOScheduler()
 
+# Text preprocessing patterns, compiled once for every collected event
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?;:-]')
+
+ABBREVIATIONS = {
+    'US': 'United States',
+    'UK': 'United Kingdom',
+    'EU': 'European Union',
+    'CEO': 'Chief Executive Officer',
+    'GDP': 'Gross Domestic Product',
+    'CPI': 'Consumer Price Index'
+}
+_ABBREVIATION_RE = re.compile(r'\b(' + '|'.join(ABBREVIATIONS) + r')\b', re.IGNORECASE)
+
+# Severity bands: below 0.6 is low, from 0.6 medium, from 0.8 high
+RISK_LEVEL_THRESHOLDS = (0.6, 0.8)
+RISK_LEVELS = ("low", "medium", "high")
+
+# Length of the capped recent events list in Redis
+MAX_RECENT_EVENTS = 500
+
+# Duplicate fingerprints remembered across collection runs
+MAX_PROCESSED_HASHES = 20000
+
+# Collection requests are coalesced: at most one collection waits behind the running one
+collection_requests: asyncio.Queue = asyncio.Queue(maxsize=1)
+collection_worker: Optional[asyncio.Task] = None
+
+@lru_cache(maxsize=8192)
+def _clean_text(text: str) -> str:
+    """Collapse whitespace, strip special characters and expand abbreviations"""
+    # Remove extra whitespace
+    text = _WHITESPACE_RE.sub(' ', text.strip())
+    
+    # Remove special characters but keep basic punctuation
+    text = _SPECIAL_CHARS_RE.sub('', text)
+    
+    # Normalize common abbreviations in a single pass
+    return _ABBREVIATION_RE.sub(lambda match: ABBREVIATIONS[match.group(1).upper()], text)
+
+SLASH_DATE_FORMATS = ('%d/%m/%Y', '%m/%d/%Y')
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(timestamp_str: str) -> str:
+    """Parse a source timestamp in one of the supported formats to ISO format"""
+    # ISO 8601, including date-only, space-separated and 'Z' forms, is parsed in C;
+    # only the slash-separated date formats need strptime
+    if '/' not in timestamp_str:
+        return datetime.fromisoformat(timestamp_str).isoformat()
+    
+    for fmt in SLASH_DATE_FORMATS:
+        try:
+            return datetime.strptime(timestamp_str, fmt).isoformat()
+        except ValueError:
+            continue
+    
+    raise ValueError("Unable to parse timestamp")
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """Compile keywords into one pattern that finds them at every position, overlaps included"""
+    # Longer keywords first so one that extends another at the same position is found
+    alternatives = sorted(keywords, key=len, reverse=True)
+    return re.compile('(?=(' + '|'.join(map(re.escape, alternatives)) + '))')
+
 class DataProcessor:
     """Enhanced data processing pipeline with validation and normalization"""
     
     def __init__(self):
-        self.processed_hashes = set()  # For duplicate detection
+        # 64-bit content fingerprints for duplicate detection, least recently seen first
+        self.processed_hashes: OrderedDict[int, None] = OrderedDict()
         self.location_mappings = self._load_location_mappings()
         self.sector_mappings = self._load_sector_mappings()
+        
+        # Partial matching scans each input once against all keys; a key's position
+        # in its mapping decides which one wins when several match
+        self._location_rank = {key: rank for rank, key in enumerate(self.location_mappings)}
+        self._location_keys_re = _keyword_pattern(self.location_mappings)
+        self._location_fragments = {}
+        for key in reversed(self.location_mappings):
+            for start in range(len(key)):
+                for end in range(start + 1, len(key) + 1):
+                    self._location_fragments[key[start:end]] = key
+        self._sector_rank = {key: rank for rank, key in enumerate(self.sector_mappings)}
+        self._sector_keys_re = _keyword_pattern(self.sector_mappings)
+        
+        # Feeds repeat the same location strings from event to event
+        self._match_location = lru_cache(maxsize=4096)(self._match_location)
     
     def _load_location_mappings(self) -> Dict[str, Dict[str, Any]]:
         """Load standardized location mappings"""
@@ -98,22 +186,23 @@ class DataProcessor:
     
     def validate_event_data(self, event: Dict[str, Any]) -> bool:
         """Validate event data quality and completeness"""
-        required_fields = ["title", "description", "severity"]
+        title = event.get("title")
+        description = event.get("description")
+        severity = event.get("severity")
         
         # Check required fields
-        for field in required_fields:
-            if not event.get(field):
+        for field, value in (("title", title), ("description", description), ("severity", severity)):
+            if not value:
                 logger.warning(f"Event missing required field: {field}")
                 return False
         
         # Validate severity range
-        severity = event.get("severity", 0)
         if not isinstance(severity, (int, float)) or not 0 <= severity <= 1:
             logger.warning(f"Invalid severity value: {severity}")
             return False
         
         # Validate title and description length
-        if len(event.get("title", "")) < 10 or len(event.get("description", "")) < 20:
+        if len(title) < 10 or len(description) < 20:
             logger.warning("Event title or description too short")
             return False
         
@@ -121,14 +210,22 @@ class DataProcessor:
     
     def detect_duplicate(self, event: Dict[str, Any]) -> bool:
         """Detect duplicate events using content hashing"""
-        # Create hash from title, description, and location
-        content = f"{event.get('title', '')}{event.get('description', '')}{event.get('location', '')}"
-        content_hash = hashlib.md5(content.encode()).hexdigest()
+        # Create a 64-bit fingerprint from title, description, and location; this is
+        # a dedup key, not a security hash, so an int is cheaper to store and compare
+        hasher = hashlib.blake2b(digest_size=8)
+        for field in ('title', 'description', 'location'):
+            hasher.update(str(event.get(field) or '').encode())
+            hasher.update(b'\x1f')
+        content_hash = int.from_bytes(hasher.digest(), 'little')
         
         if content_hash in self.processed_hashes:
+            self.processed_hashes.move_to_end(content_hash)
             return True
         
-        self.processed_hashes.add(content_hash)
+        self.processed_hashes[content_hash] = None
+        if len(self.processed_hashes) > MAX_PROCESSED_HASHES:
+            # Evict the fingerprint that has gone longest without a repeat
+            self.processed_hashes.popitem(last=False)
         return False
     
     def preprocess_text(self, text: str) -> str:
@@ -136,42 +233,16 @@ class DataProcessor:
         if not text:
             return ""
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s.,!?;:-]', '', text)
-        
-        # Normalize common abbreviations
-        abbreviations = {
-            r'\bUS\b': 'United States',
-            r'\bUK\b': 'United Kingdom',
-            r'\bEU\b': 'European Union',
-            r'\bCEO\b': 'Chief Executive Officer',
-            r'\bGDP\b': 'Gross Domestic Product',
-            r'\bCPI\b': 'Consumer Price Index'
-        }
-        
-        for abbrev, full_form in abbreviations.items():
-            text = re.sub(abbrev, full_form, text, flags=re.IGNORECASE)
-        
-        return text
+        return _clean_text(text)
     
     def standardize_location(self, location: str) -> Dict[str, Any]:
         """Standardize location information"""
         if not location:
             return {"standard_name": "", "country": "", "region": "", "coordinates": [0, 0]}
         
-        location_lower = location.lower().strip()
-        
-        # Direct mapping lookup
-        if location_lower in self.location_mappings:
-            return self.location_mappings[location_lower]
-        
-        # Fuzzy matching for partial matches
-        for key, value in self.location_mappings.items():
-            if key in location_lower or location_lower in key:
-                return value
+        location_info = self._match_location(location.lower().strip())
+        if location_info:
+            return location_info
         
         # Default fallback
         return {
@@ -181,6 +252,22 @@ class DataProcessor:
             "coordinates": [0, 0]
         }
     
+    def _match_location(self, location_lower: str) -> Optional[Dict[str, Any]]:
+        """Find the mapping entry for a normalized location string, if any"""
+        # Direct mapping lookup
+        if location_lower in self.location_mappings:
+            return self.location_mappings[location_lower]
+        
+        # Fuzzy matching for partial matches: known keys inside the input, or the
+        # input being part of a known key
+        candidates = {match.group(1) for match in self._location_keys_re.finditer(location_lower)}
+        if location_lower in self._location_fragments:
+            candidates.add(self._location_fragments[location_lower])
+        if candidates:
+            return self.location_mappings[min(candidates, key=self._location_rank.__getitem__)]
+        
+        return None
+    
     def standardize_sectors(self, sectors: List[str]) -> List[str]:
         """Standardize sector names"""
         if not sectors:
@@ -195,17 +282,16 @@ class DataProcessor:
                 standardized.add(self.sector_mappings[sector_lower])
             else:
                 # Check for partial matches
-                for key, value in self.sector_mappings.items():
-                    if key in sector_lower:
-                        standardized.add(value)
-                        break
+                keys = {match.group(1) for match in self._sector_keys_re.finditer(sector_lower)}
+                if keys:
+                    standardized.add(self.sector_mappings[min(keys, key=self._sector_rank.__getitem__)])
                 else:
                     # Keep original if no mapping found
                     standardized.add(sector_lower)
         
         return list(standardized)
     
-    def align_timestamp(self, event: Dict[str, Any]) -> str:
+    def align_timestamp(self, event: Dict[str, Any], default: Optional[str] = None) -> str:
         """Ensure consistent timestamp format across all events"""
         # Try to extract timestamp from various fields
         timestamp_fields = ['published_at', 'date', 'timestamp', 'created_at']
@@ -213,41 +299,20 @@ class DataProcessor:
         for field in timestamp_fields:
             if field in event and event[field]:
                 try:
-                    # Parse various timestamp formats
-                    timestamp_str = str(event[field])
-                    
-                    # ISO format
-                    if 'T' in timestamp_str:
-                        dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                    # Date only
-                    elif '-' in timestamp_str and len(timestamp_str) == 10:
-                        dt = datetime.strptime(timestamp_str, '%Y-%m-%d')
-                    # Other common formats
-                    else:
-                        # Try multiple formats
-                        formats = ['%Y-%m-%d %H:%M:%S', '%d/%m/%Y', '%m/%d/%Y']
-                        dt = None
-                        for fmt in formats:
-                            try:
-                                dt = datetime.strptime(timestamp_str, fmt)
-                                break
-                            except ValueError:
-                                continue
-                        
-                        if dt is None:
-                            raise ValueError("Unable to parse timestamp")
-                    
-                    return dt.isoformat()
+                    value = event[field]
+                    return _parse_timestamp(value if isinstance(value, str) else str(value))
                 
                 except (ValueError, TypeError) as e:
                     logger.warning(f"Failed to parse timestamp {event[field]}: {e}")
                     continue
         
-        # Default to current time if no valid timestamp found
-        return datetime.utcnow().isoformat()
+        # Default to the supplied (or current) time if no valid timestamp found
+        return default or datetime.utcnow().isoformat()
     
-    def process_event(self, event: Dict[str, Any], source: str) -> Optional[Dict[str, Any]]:
+    def process_event(self, event: Dict[str, Any], source: str, processed_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Process a single event through the complete pipeline"""
+        # Batches pass one shared ISO timestamp instead of reading the clock per event
+        processed_at = processed_at or datetime.utcnow().isoformat()
         try:
             # Step 1: Validate data quality
             if not self.validate_event_data(event):
@@ -259,24 +324,25 @@ class DataProcessor:
                 return None
             
             # Step 3: Text preprocessing
-            event['title'] = self.preprocess_text(event.get('title', ''))
-            event['description'] = self.preprocess_text(event.get('description', ''))
+            event['title'] = title = self.preprocess_text(event.get('title', ''))
+            event['description'] = description = self.preprocess_text(event.get('description', ''))
             
             # Step 4: Geographic standardization
             location_info = self.standardize_location(event.get('location', ''))
             event['location_standardized'] = location_info
             
             # Step 5: Sector standardization
-            sectors = event.get('impact_sectors', [])
-            event['impact_sectors'] = self.standardize_sectors(sectors)
+            event['impact_sectors'] = sectors = self.standardize_sectors(event.get('impact_sectors', []))
             
             # Step 6: Time series alignment
-            event['timestamp'] = self.align_timestamp(event)
+            event['timestamp'] = timestamp = self.align_timestamp(event, default=processed_at)
             
             # Step 7: Add metadata
             event['source'] = source
-            event['processed_at'] = datetime.utcnow().isoformat()
-            event['data_quality_score'] = self._calculate_quality_score(event)
+            event['processed_at'] = processed_at
+            event['data_quality_score'] = self._calculate_quality_score(
+                title, description, location_info, sectors, timestamp
+            )
             
             return event
             
@@ -284,31 +350,19 @@ class DataProcessor:
             logger.error(f"Error processing event from {source}: {e}")
             return None
     
-    def _calculate_quality_score(self, event: Dict[str, Any]) -> float:
+    def _calculate_quality_score(self, title: str, description: str, location_info: Dict[str, Any],
+                                 sectors: List[str], timestamp: str) -> float:
         """Calculate data quality score for the event"""
-        score = 0.0
-        
-        # Title quality (0-0.2)
-        title_len = len(event.get('title', ''))
-        score += min(0.2, title_len / 100)
-        
-        # Description quality (0-0.3)
-        desc_len = len(event.get('description', ''))
-        score += min(0.3, desc_len / 200)
-        
-        # Location standardization (0-0.2)
-        if event.get('location_standardized', {}).get('country'):
-            score += 0.2
-        
-        # Sector identification (0-0.2)
-        if event.get('impact_sectors'):
-            score += min(0.2, len(event['impact_sectors']) * 0.05)
-        
-        # Timestamp validity (0-0.1)
-        if event.get('timestamp'):
-            score += 0.1
-        
-        return min(1.0, score)
+        # Components: title (0-0.2), description (0-0.3), location standardization (0-0.2),
+        # sector identification (0-0.2) and timestamp validity (0-0.1)
+        return min(
+            1.0,
+            min(0.2, len(title) / 100)
+            + min(0.3, len(description) / 200)
+            + (0.2 if location_info.get('country') else 0.0)
+            + min(0.2, len(sectors) * 0.05)
+            + (0.1 if timestamp else 0.0)
+        )
 
 # Initialize data processor
 data_processor = DataProcessor()
@@ -332,25 +386,21 @@ class ScheduledDataCollector:
             # Collect data from all sources
             collected_data = await data_orchestrator.collect_all_data()
             
-            all_processed_events = []
+            # Validation, regex cleanup and hashing are CPU-bound, so the batch is
+            # processed in a worker thread to keep the API responsive meanwhile
+            all_processed_events = await asyncio.to_thread(self._process_collected_data, collected_data)
             
-            # Process each data source
-            for source_name, events in collected_data.items():
-                logger.info(f"Processing {len(events)} events from {source_name}")
-                
-                for event in events:
-                    processed_event = data_processor.process_event(event, source_name)
-                    if processed_event:
-                        all_processed_events.append(processed_event)
-                        
-                        # Store in database
-                        await self._store_event_in_database(processed_event)
-                        
-                        # Cache in Redis
-                        await self._cache_event_in_redis(processed_event)
-                        
-                        # Publish to message queue
-                        await self._publish_event_to_queue(processed_event)
+            # Store the whole batch in the database with one bulk insert
+            await self._store_events_in_database(all_processed_events)
+            
+            # Each event is encoded once and the same bytes are reused for Redis and RabbitMQ
+            payloads = self._serialize_events(all_processed_events)
+            
+            # Caching and publishing are independent once database IDs are assigned
+            await asyncio.gather(
+                self._cache_events_in_redis(all_processed_events, payloads),
+                self._publish_events_to_queue(payloads)
+            )
             
             # Update collection statistics
             self.collection_stats["total_collected"] += len(all_processed_events)
@@ -365,69 +415,133 @@ class ScheduledDataCollector:
             logger.error(f"Error in scheduled data collection: {e}")
             return []
     
-    async def _store_event_in_database(self, event: Dict[str, Any]):
-        """Store processed event in PostgreSQL database"""
-        try:
-            db = next(get_db())
+    def _process_collected_data(self, collected_data: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Run every collected event through the data processor"""
+        all_processed_events = []
+        
+        # One timestamp for the whole collection cycle
+        cycle_timestamp = datetime.utcnow().isoformat()
+        
+        # Process each data source
+        for source_name, events in collected_data.items():
+            logger.info(f"Processing {len(events)} events from {source_name}")
             
-            db_event = SupplyChainEvent(
-                title=event.get('title', ''),
-                description=event.get('description', ''),
-                event_type=event.get('source', 'unknown'),
-                severity=event.get('severity', 0.0),
-                location=event.get('location_standardized', {}).get('standard_name', ''),
-                impact_sectors=event.get('impact_sectors', []),
-                raw_data=event,
-                created_at=datetime.fromisoformat(event.get('timestamp', datetime.utcnow().isoformat()))
-            )
+            for event in events:
+                processed_event = data_processor.process_event(event, source_name, processed_at=cycle_timestamp)
+                if processed_event:
+                    all_processed_events.append(processed_event)
+        
+        return all_processed_events
+    
+    async def _store_events_in_database(self, events: List[Dict[str, Any]]):
+        """Store processed events in PostgreSQL database"""
+        if not events:
+            return
+        
+        try:
+            # IDs are generated client-side so the batch needs no RETURNING round-trip
+            rows = []
+            for event in events:
+                timestamp = datetime.fromisoformat(event.get('timestamp') or event['processed_at'])
+                rows.append({
+                    "id": uuid.uuid4(),
+                    "title": event.get('title', ''),
+                    "description": event.get('description', ''),
+                    "event_type": event.get('source', 'unknown'),
+                    "source": event.get('source', 'unknown'),
+                    "severity": event.get('severity', 0.0),
+                    "location": event.get('location_standardized', {}).get('standard_name', ''),
+                    "impact_sectors": event.get('impact_sectors', []),
+                    "timestamp": timestamp,
+                    "created_at": timestamp
+                })
             
-            db.add(db_event)
-            db.commit()
-            db.refresh(db_event)
+            # The synchronous session runs in a worker thread to keep the event loop free
+            await asyncio.to_thread(self._insert_event_rows, rows)
             
             # Add database ID to event
-            event['database_id'] = str(db_event.id)
+            for event, row in zip(events, rows):
+                event['database_id'] = str(row["id"])
             
         except Exception as e:
-            logger.error(f"Error storing event in database: {e}")
+            logger.error(f"Error storing {len(events)} events in database: {e}")
+    
+    def _insert_event_rows(self, rows: List[Dict[str, Any]]):
+        """Bulk insert event rows in a single transaction"""
+        db = SessionLocal()
+        try:
+            db.execute(insert(SupplyChainEvent), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
         finally:
             db.close()
     
-    async def _cache_event_in_redis(self, event: Dict[str, Any]):
-        """Cache processed event in Redis for fast access"""
+    def _serialize_events(self, events: List[Dict[str, Any]]) -> List[bytes]:
+        """Tag each event for downstream routing and encode it to JSON bytes"""
+        # Stamp the batch once; the article's own published_at is left untouched
+        queued_at = datetime.utcnow().isoformat()
+        
+        payloads = []
+        for event in events:
+            # Tag the severity band for downstream routing decisions
+            risk_level = RISK_LEVELS[bisect_right(RISK_LEVEL_THRESHOLDS, event.get('severity', 0.0))]
+            
+            payloads.append(orjson.dumps({**event, 'risk_level': risk_level, 'queued_at': queued_at}, default=str))
+        
+        return payloads
+    
+    async def _cache_events_in_redis(self, events: List[Dict[str, Any]], payloads: List[bytes]):
+        """Cache processed events in Redis for fast access"""
+        if not events:
+            return
+        
         try:
-            # Cache by location
-            location = event.get('location_standardized', {}).get('standard_name', '')
-            if location:
-                await redis_client.cache_real_time_data(f"location:{location}", event, ttl=3600)
+            by_location: Dict[str, List[bytes]] = {}
+            by_sector: Dict[str, List[bytes]] = {}
+            
+            for event, payload in zip(events, payloads):
+                # Group by location
+                location = event.get('location_standardized', {}).get('standard_name', '')
+                if location:
+                    by_location.setdefault(location, []).append(payload)
+                
+                # Group by sectors
+                for sector in event.get('impact_sectors', []):
+                    by_sector.setdefault(sector, []).append(payload)
+            
+            # Bucket values are JSON arrays spliced from the already-encoded events
+            entries = [(f"location:{location}", b"[" + b",".join(group) + b"]", 3600) for location, group in by_location.items()]
+            entries.extend((f"sector:{sector}", b"[" + b",".join(group) + b"]", 3600) for sector, group in by_sector.items())
             
-            # Cache by sectors
-            for sector in event.get('impact_sectors', []):
-                await redis_client.cache_real_time_data(f"sector:{sector}", event, ttl=3600)
+            # Each event is also appended to a bounded per-source stream in the same pipeline
+            stream_entries = [(f"events:{event.get('source', 'unknown')}", payload) for event, payload in zip(events, payloads)]
             
-            # Cache recent events
-            await redis_client.cache_real_time_data("recent_events", event, ttl=1800)
+            await asyncio.to_thread(self._write_cache, entries, stream_entries, payloads)
             
         except Exception as e:
-            logger.error(f"Error caching event in Redis: {e}")
+            logger.error(f"Error caching events in Redis: {e}")
+    
+    def _write_cache(self, entries: List[tuple], stream_entries: List[tuple], payloads: List[bytes]):
+        """Write a batch's cache keys, stream entries and recent events list"""
+        redis_client.set_many(entries, stream_entries)
+        
+        # Recent events accumulate across batches in a capped list, batch order kept head-first
+        redis_client.push_capped("recent_events", payloads[::-1], MAX_RECENT_EVENTS, ttl=1800)
     
-    async def _publish_event_to_queue(self, event: Dict[str, Any]):
-        """Publish processed event to message queue for downstream processing"""
+    async def _publish_events_to_queue(self, payloads: List[bytes]):
+        """Publish processed events to message queue for downstream processing"""
+        # The blocking pika channel is driven from a single worker thread per batch
         try:
-            # Determine event type for routing
-            severity = event.get('severity', 0.0)
-            
-            if severity >= 0.8:
-                event_type = EventType.HIGH_RISK_DETECTED
-            elif severity >= 0.6:
-                event_type = EventType.MEDIUM_RISK_DETECTED
-            else:
-                event_type = EventType.DATA_COLLECTED
-            
-            await message_queue.publish_event(event_type, event)
-            
+            await asyncio.to_thread(
+                message_queue.publish_events,
+                Exchanges.SUPPLY_CHAIN_EVENTS,
+                EventTypes.DATA_COLLECTED,
+                payloads
+            )
         except Exception as e:
-            logger.error(f"Error publishing event to queue: {e}")
+            logger.error(f"Error publishing events to queue: {e}")
 
 # Initialize scheduled collector
 scheduled_collector = ScheduledDataCollector()
@@ -436,11 +550,21 @@ scheduled_collector = ScheduledDataCollector()
 @app.on_event("startup")
 async def startup_event():
     """Configure and start the scheduler on application startup"""
+    global collection_worker, redis_client, message_queue
+    redis_client = RedisClient()
+    # MessageQueue opens a blocking connection in its constructor
+    message_queue = await asyncio.to_thread(MessageQueue)
+    
+    collection_worker = asyncio.create_task(process_collection_requests())
+    
     logger.info("Starting Data Collection Service scheduler")
     
+    # Interval ticks only enqueue a collection, so they stay on fixed boundaries
+    # however long a run takes, and coinciding ticks collapse into one run
+    
     # Schedule high-frequency data collection (every 15 minutes)
     scheduler.add_job(
-        scheduled_collector.collect_and_process_all_data,
+        request_collection,
         trigger=IntervalTrigger(minutes=15),
         id="high_frequency_collection",
         name="High Frequency Data Collection",
@@ -449,7 +573,7 @@ async def startup_event():
     
     # Schedule comprehensive data collection (every 2 hours)
     scheduler.add_job(
-        scheduled_collector.collect_and_process_all_data,
+        request_collection,
         trigger=IntervalTrigger(hours=2),
         id="comprehensive_collection",
         name="Comprehensive Data Collection",
@@ -471,19 +595,39 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Shutdown scheduler gracefully"""
-    scheduler.shutdown()
+    if scheduler.running:
+        scheduler.shutdown()
+    if collection_worker:
+        collection_worker.cancel()
+    await data_orchestrator.close()
+    if message_queue:
+        message_queue.close()
     logger.info("Scheduler shutdown completed")
 
+async def request_collection() -> bool:
+    """Queue a collection run; returns False if one is already pending"""
+    # Async so AsyncIOScheduler runs it on the event loop rather than in its thread pool
+    try:
+        collection_requests.put_nowait(datetime.utcnow())
+        return True
+    except asyncio.QueueFull:
+        return False
+
+async def process_collection_requests():
+    """Run queued collections one at a time"""
+    while True:
+        await collection_requests.get()
+        try:
+            await scheduled_collector.collect_and_process_all_data()
+        finally:
+            collection_requests.task_done()
+
 async def cleanup_old_data():
-    """Clean up old processed hashes and temporary data"""
+    """Daily maintenance of collector state"""
     try:
-        # Clear old processed hashes (keep last 10000)
-        if len(data_processor.processed_hashes) > 10000:
-            # Keep only the most recent hashes (simplified approach)
-            data_processor.processed_hashes = set(list(data_processor.processed_hashes)[-5000:])
-        
-        # Clean up old Redis cache entries
-        await redis_client.cleanup_expired_data()
+        # Processed hashes are bounded by detect_duplicate's LRU eviction, and every
+        # Redis key the collector writes carries a TTL or a capped stream length
+        logger.info(f"Tracking {len(data_processor.processed_hashes)} processed hashes")
         
         logger.info("Daily cleanup completed successfully")
         
@@ -505,12 +649,16 @@ async def health_check():
     }
 
 @app.post("/collect")
-async def trigger_manual_collection(background_tasks: BackgroundTasks):
+async def trigger_manual_collection():
     """Manually trigger data collection"""
-    background_tasks.add_task(scheduled_collector.collect_and_process_all_data)
+    if await request_collection():
+        message = "Data collection triggered"
+    else:
+        # A collection is already pending and will pick up the latest data
+        message = "Data collection already pending"
     
     return {
-        "message": "Data collection triggered",
+        "message": message,
         "timestamp": datetime.utcnow().isoformat()
     }
 
@@ -524,22 +672,10 @@ async def get_data_sources_status():
         "collection_errors": scheduled_collector.collection_stats.get("errors", 0)
     }
 
-@app.get("/events/recent")
-async def get_recent_events(limit: int = 50):
-    """Get recently collected and processed events"""
+def _query_recent_events(limit: int) -> List[Dict[str, Any]]:
+    """Load the most recent events from the database"""
+    db = SessionLocal()
     try:
-        # Get from Redis cache first
-        cached_events = await redis_client.get_cached_data("recent_events")
-        
-        if cached_events:
-            return {
-                "events": cached_events[:limit],
-                "source": "cache",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-        
-        # Fallback to database
-        db = next(get_db())
         events = db.query(SupplyChainEvent).order_by(SupplyChainEvent.created_at.desc()).limit(limit).all()
         
         event_data = []
@@ -555,6 +691,27 @@ async def get_recent_events(limit: int = 50):
                 "event_type": event.event_type
             })
         
+        return event_data
+    finally:
+        db.close()
+
+@app.get("/events/recent")
+async def get_recent_events(limit: int = 50):
+    """Get recently collected and processed events"""
+    try:
+        # Get from Redis cache first
+        cached_events = await asyncio.to_thread(redis_client.get_list, "recent_events", limit)
+        
+        if cached_events:
+            return {
+                "events": cached_events,
+                "source": "cache",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        
+        # Fallback to database
+        event_data = await asyncio.to_thread(_query_recent_events, limit)
+        
         return {
             "events": event_data,
             "source": "database",
@@ -607,4 +764,4 @@ async def get_collection_statistics():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop="uvloop", http="httptools")
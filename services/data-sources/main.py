@@ -3,13 +3,18 @@ Data Sources Service - External data integration for supply chain intelligence
 """
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 import asyncio
 import aiohttp
+from aiolimiter import AsyncLimiter
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-import json
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
+import orjson
 import os
+import time
+import hashlib
+import zlib
 from dataclasses import dataclass
 import sys
 
@@ -25,12 +30,101 @@ from message_queue import MessageQueue, EventTypes, Exchanges
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Data Sources Service", version="1.0.0")
+app = FastAPI(title="Data Sources Service", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Initialize clients
 redis_client = RedisClient()
 message_queue = MessageQueue()
 
+# Per-source cache lifetimes for collected data, matching the API response caches
+SOURCE_CACHE_TTLS = {
+    'news': 1800,
+    'weather': 600,
+    'economic': 3600,
+    'shipping': 3600
+}
+
+# Attempts per request when the upstream API answers 429 Too Many Requests
+MAX_RATE_LIMIT_ATTEMPTS = 3
+
+# Cached API responses outlive their TTL by this long so they can be served stale
+# while one worker refreshes them, or when the upstream API is failing
+STALE_CACHE_TTL = 6 * 3600
+REFRESH_LOCK_TTL = 30
+
+# Requests currently being fetched, so concurrent callers for the same request share one
+inflight_requests: Dict[str, asyncio.Task] = {}
+
+async def fetch_json(session: aiohttp.ClientSession, url: str, params: Dict, limiter: AsyncLimiter,
+                     semaphore: asyncio.Semaphore, cache_ttl: Optional[int] = None) -> Optional[Dict]:
+    """GET a JSON document, served from the Redis cache while younger than cache_ttl"""
+    # Key on the full request so each search term, location and series is tracked separately
+    request_id = hashlib.sha1(f"{url}?{sorted(params.items())}".encode()).hexdigest()
+    
+    task = inflight_requests.get(request_id)
+    if task is None:
+        task = asyncio.create_task(_fetch_json(session, url, params, limiter, semaphore, cache_ttl, request_id))
+        inflight_requests[request_id] = task
+        task.add_done_callback(lambda _: inflight_requests.pop(request_id, None))
+    
+    # Shielded so one caller giving up does not cancel the fetch for the others
+    return await asyncio.shield(task)
+
+async def _fetch_json(session: aiohttp.ClientSession, url: str, params: Dict, limiter: AsyncLimiter,
+                      semaphore: asyncio.Semaphore, cache_ttl: Optional[int], request_id: str) -> Optional[Dict]:
+    """Fetch a JSON document through the Redis response cache"""
+    if not cache_ttl:
+        return await _request_json(session, url, params, limiter, semaphore)
+    
+    cache_key = f"external_api:{request_id}"
+    raw = await asyncio.to_thread(redis_client.get_raw, cache_key)
+    cached = orjson.loads(raw) if raw else None
+    
+    fetched_at = time.time()
+    if cached and fetched_at - cached['fetched_at'] < cache_ttl:
+        return cached['data']
+    
+    # Only the worker that takes the lock refreshes an expired entry; the rest serve it stale
+    if cached and not await asyncio.to_thread(redis_client.acquire_lock, f"{cache_key}:refresh", REFRESH_LOCK_TTL):
+        return cached['data']
+    
+    data = await _request_json(session, url, params, limiter, semaphore)
+    if data is None:
+        return cached['data'] if cached else None
+    
+    entry = orjson.dumps({'fetched_at': fetched_at, 'data': data})
+    await asyncio.to_thread(redis_client.set_many, [(cache_key, entry, cache_ttl + STALE_CACHE_TTL)])
+    return data
+
+async def _request_json(session: aiohttp.ClientSession, url: str, params: Dict, limiter: AsyncLimiter,
+                        semaphore: asyncio.Semaphore) -> Optional[Dict]:
+    """GET a JSON document within the source's rate and concurrency limits, returning None on failure"""
+    for attempt in range(MAX_RATE_LIMIT_ATTEMPTS):
+        # The limiter spaces requests over time; the semaphore caps how many are open at once
+        async with limiter, semaphore:
+            try:
+                async with session.get(url, params=params) as response:
+                    remaining = response.headers.get('X-RateLimit-Remaining')
+                    if remaining is not None:
+                        logger.debug(f"{url} rate limit remaining: {remaining}")
+                    if response.status == 200:
+                        # Parse the raw body directly rather than decoding it to str first
+                        return orjson.loads(await response.read())
+                    if response.status != 429:
+                        return None
+                    retry_after = response.headers.get('Retry-After', '')
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Returning None lets the caller fall back to a stale cached copy
+                logger.error(f"Error requesting {url}: {e}")
+                return None
+        
+        # Back off as the API asks, or exponentially when it does not say
+        delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt
+        logger.warning(f"Rate limited by {url}, retrying in {delay}s")
+        await asyncio.sleep(delay)
+    
+    return None
+
 @dataclass
 class DataSourceConfig:
     """Configuration for external data sources"""
@@ -39,6 +133,23 @@ class DataSourceConfig:
     fred_api_key: str = os.getenv('FRED_API_KEY', '')
     marine_traffic_api_key: str = os.getenv('MARINE_TRAFFIC_API_KEY', '')
 
+@dataclass(frozen=True, slots=True)
+class WeatherLocation:
+    """A monitored location with its prebuilt OpenWeather query parameters"""
+    name: str
+    lat: float
+    lon: float
+    params: Dict[str, Any]
+    coordinates: Dict[str, float]
+
+@dataclass(frozen=True, slots=True)
+class EconomicSeries:
+    """A FRED series with its prebuilt query parameters and response cache lifetime"""
+    indicator: str
+    series_id: str
+    params: Dict[str, Any]
+    cache_ttl: int
+
 class NewsDataCollector:
     """Collect news data from multiple sources"""
     
@@ -48,6 +159,15 @@ class NewsDataCollector:
             'newsapi': 'https://newsapi.org/v2',
             'google_news': 'https://newsapi.org/v2',  # Using NewsAPI for Google News
         }
+        # Shared by all concurrent search-term requests
+        self.limiter = AsyncLimiter(max_rate=60, time_period=60)
+        self.semaphore = asyncio.Semaphore(6)
+        self.base_params = {
+            'apiKey': self.api_key,
+            'language': 'en',
+            'sortBy': 'publishedAt',
+            'pageSize': 20
+        }
         
     async def fetch_supply_chain_news(self, session: aiohttp.ClientSession) -> List[Dict]:
         """Fetch supply chain related news"""
@@ -63,46 +183,45 @@ class NewsDataCollector:
                 'semiconductor shortage'
             ]
             
-            all_articles = []
-            
-            for term in search_terms:
-                url = f"{self.base_urls['newsapi']}/everything"
-                params = {
-                    'q': term,
-                    'apiKey': self.api_key,
-                    'language': 'en',
-                    'sortBy': 'publishedAt',
-                    'from': (datetime.now() - timedelta(days=7)).isoformat(),
-                    'pageSize': 20
-                }
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = data.get('articles', [])
-                        
-                        for article in articles:
-                            processed_article = {
-                                'source': 'newsapi',
-                                'title': article.get('title', ''),
-                                'description': article.get('description', ''),
-                                'url': article.get('url', ''),
-                                'published_at': article.get('publishedAt', ''),
-                                'search_term': term,
-                                'sentiment_score': None,  # To be analyzed later
-                                'relevance_score': None,  # To be calculated
-                                'impact_level': 'unknown'
-                            }
-                            all_articles.append(processed_article)
-                    
-                    # Rate limiting
-                    await asyncio.sleep(0.5)
+            # Query every search term concurrently over the shared session
+            # Day precision keeps the request, and so its cache key, stable across runs
+            since = (datetime.now() - timedelta(days=7)).date().isoformat()
+            results = await asyncio.gather(
+                *(self._fetch_search_term(session, term, since) for term in search_terms)
+            )
             
-            return all_articles
+            return [article for articles in results for article in articles]
             
         except Exception as e:
             logger.error(f"Error fetching news data: {e}")
             return []
+    
+    async def _fetch_search_term(self, session: aiohttp.ClientSession, term: str, since: str) -> List[Dict]:
+        """Fetch news articles matching one search term"""
+        url = f"{self.base_urls['newsapi']}/everything"
+        params = {**self.base_params, 'q': term, 'from': since}
+        
+        data = await fetch_json(session, url, params, self.limiter, self.semaphore, cache_ttl=1800)
+        if data is None:
+            return []
+        
+        return [
+            {
+                'source': 'newsapi',
+                'title': article.get('title', ''),
+                'description': article.get('description', ''),
+                'url': article.get('url', ''),
+                'published_at': article.get('publishedAt', ''),
+                'search_term': term,
+                'sentiment_score': None,  # To be analyzed later
+                'relevance_score': None,  # To be calculated
+                'impact_level': 'unknown'
+            }
+            for article in data.get('articles', [])
+        ]
+
+SEVERE_WEATHER_CONDITIONS = frozenset({'thunderstorm', 'snow', 'extreme'})
+MODERATE_WEATHER_CONDITIONS = frozenset({'rain', 'drizzle'})
 
 class WeatherDataCollector:
     """Collect weather data for supply chain impact analysis"""
@@ -110,72 +229,79 @@ class WeatherDataCollector:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = 'https://api.openweathermap.org/data/2.5'
+        self.current_url = f"{self.base_url}/weather"
+        self.forecast_url = f"{self.base_url}/forecast"
+        # OpenWeather free tier allows 60 calls a minute
+        self.limiter = AsyncLimiter(max_rate=60, time_period=60)
+        self.semaphore = asyncio.Semaphore(8)
         
         # Major ports and logistics hubs
-        self.critical_locations = [
-            {'name': 'Los Angeles Port', 'lat': 33.7361, 'lon': -118.2640},
-            {'name': 'Long Beach Port', 'lat': 33.7701, 'lon': -118.2137},
-            {'name': 'New York Port', 'lat': 40.6892, 'lon': -74.0445},
-            {'name': 'Shanghai Port', 'lat': 31.2304, 'lon': 121.4737},
-            {'name': 'Singapore Port', 'lat': 1.2966, 'lon': 103.8764},
-            {'name': 'Rotterdam Port', 'lat': 51.9225, 'lon': 4.4792},
-            {'name': 'Hamburg Port', 'lat': 53.5511, 'lon': 9.9937},
-            {'name': 'Suez Canal', 'lat': 30.5852, 'lon': 32.2654}
+        locations = [
+            ('Los Angeles Port', 33.7361, -118.2640),
+            ('Long Beach Port', 33.7701, -118.2137),
+            ('New York Port', 40.6892, -74.0445),
+            ('Shanghai Port', 31.2304, 121.4737),
+            ('Singapore Port', 1.2966, 103.8764),
+            ('Rotterdam Port', 51.9225, 4.4792),
+            ('Hamburg Port', 53.5511, 9.9937),
+            ('Suez Canal', 30.5852, 32.2654)
         ]
+        # Query parameters are built once here and reused by every fetch
+        self.critical_locations = tuple(
+            WeatherLocation(
+                name=name,
+                lat=lat,
+                lon=lon,
+                params={'lat': lat, 'lon': lon, 'appid': self.api_key, 'units': 'metric'},
+                coordinates={'lat': lat, 'lon': lon}
+            )
+            for name, lat, lon in locations
+        )
     
     async def fetch_weather_data(self, session: aiohttp.ClientSession) -> List[Dict]:
         """Fetch current weather and forecasts for critical locations"""
         try:
-            weather_data = []
-            
-            for location in self.critical_locations:
-                # Current weather
-                current_url = f"{self.base_url}/weather"
-                current_params = {
-                    'lat': location['lat'],
-                    'lon': location['lon'],
-                    'appid': self.api_key,
-                    'units': 'metric'
-                }
-                
-                async with session.get(current_url, params=current_params) as response:
-                    if response.status == 200:
-                        current_data = await response.json()
-                        
-                        # Forecast data
-                        forecast_url = f"{self.base_url}/forecast"
-                        async with session.get(forecast_url, params=current_params) as forecast_response:
-                            if forecast_response.status == 200:
-                                forecast_data = await forecast_response.json()
-                                
-                                processed_data = {
-                                    'location': location['name'],
-                                    'coordinates': {'lat': location['lat'], 'lon': location['lon']},
-                                    'current_weather': {
-                                        'temperature': current_data['main']['temp'],
-                                        'humidity': current_data['main']['humidity'],
-                                        'pressure': current_data['main']['pressure'],
-                                        'wind_speed': current_data['wind']['speed'],
-                                        'wind_direction': current_data['wind'].get('deg', 0),
-                                        'weather_condition': current_data['weather'][0]['main'],
-                                        'description': current_data['weather'][0]['description'],
-                                        'visibility': current_data.get('visibility', 0)
-                                    },
-                                    'forecast': self._process_forecast(forecast_data),
-                                    'risk_assessment': self._assess_weather_risk(current_data, forecast_data),
-                                    'timestamp': datetime.now().isoformat()
-                                }
-                                weather_data.append(processed_data)
-                
-                # Rate limiting
-                await asyncio.sleep(0.2)
+            # Fetch every location concurrently over the shared session, stamped with one batch timestamp
+            timestamp = datetime.now().isoformat()
+            results = await asyncio.gather(
+                *(self._fetch_location_weather(session, location, timestamp) for location in self.critical_locations)
+            )
             
-            return weather_data
+            return [processed_data for processed_data in results if processed_data]
             
         except Exception as e:
             logger.error(f"Error fetching weather data: {e}")
             return []
     
+    async def _fetch_location_weather(self, session: aiohttp.ClientSession, location: WeatherLocation,
+                                      timestamp: str) -> Optional[Dict]:
+        """Fetch current weather and forecast for one location"""
+        # Current weather and forecast are independent requests
+        current_data, forecast_data = await asyncio.gather(
+            fetch_json(session, self.current_url, location.params, self.limiter, self.semaphore, cache_ttl=600),
+            fetch_json(session, self.forecast_url, location.params, self.limiter, self.semaphore, cache_ttl=600)
+        )
+        if current_data is None or forecast_data is None:
+            return None
+        
+        return {
+            'location': location.name,
+            'coordinates': location.coordinates,
+            'current_weather': {
+                'temperature': current_data['main']['temp'],
+                'humidity': current_data['main']['humidity'],
+                'pressure': current_data['main']['pressure'],
+                'wind_speed': current_data['wind']['speed'],
+                'wind_direction': current_data['wind'].get('deg', 0),
+                'weather_condition': current_data['weather'][0]['main'],
+                'description': current_data['weather'][0]['description'],
+                'visibility': current_data.get('visibility', 0)
+            },
+            'forecast': self._process_forecast(forecast_data),
+            'risk_assessment': self._assess_weather_risk(current_data, forecast_data),
+            'timestamp': timestamp
+        }
+    
     def _process_forecast(self, forecast_data: Dict) -> List[Dict]:
         """Process 5-day forecast data"""
         forecasts = []
@@ -211,9 +337,9 @@ class WeatherDataCollector:
             risk_factors['wind_risk'] = 'medium'
         
         # Severe weather check
-        if weather_condition in ['thunderstorm', 'snow', 'extreme']:
+        if weather_condition in SEVERE_WEATHER_CONDITIONS:
             risk_factors['severe_weather_risk'] = 'high'
-        elif weather_condition in ['rain', 'drizzle']:
+        elif weather_condition in MODERATE_WEATHER_CONDITIONS:
             risk_factors['severe_weather_risk'] = 'medium'
         
         # Visibility risk
@@ -225,15 +351,20 @@ class WeatherDataCollector:
         # Check forecast for upcoming risks
         forecast_items = forecast.get('list', [])[:8]  # Next 24 hours
         for item in forecast_items:
-            if item.get('pop', 0) > 0.7:  # High precipitation probability
+            pop = item.get('pop', 0)
+            if pop > 0.7:  # High precipitation probability
                 risk_factors['precipitation_risk'] = 'high'
                 break
-            elif item.get('pop', 0) > 0.4:
+            elif pop > 0.4:
                 risk_factors['precipitation_risk'] = 'medium'
         
         # Overall risk calculation
-        high_risks = sum(1 for risk in risk_factors.values() if risk == 'high')
-        medium_risks = sum(1 for risk in risk_factors.values() if risk == 'medium')
+        high_risks = medium_risks = 0
+        for risk in risk_factors.values():
+            if risk == 'high':
+                high_risks += 1
+            elif risk == 'medium':
+                medium_risks += 1
         
         if high_risks >= 2:
             risk_factors['overall_risk'] = 'high'
@@ -248,6 +379,9 @@ class EconomicDataCollector:
     def __init__(self, fred_api_key: str):
         self.fred_api_key = fred_api_key
         self.fred_base_url = 'https://api.stlouisfed.org/fred'
+        # FRED allows 120 requests a minute
+        self.limiter = AsyncLimiter(max_rate=120, time_period=60)
+        self.semaphore = asyncio.Semaphore(10)
         
         # Key economic indicators
         self.indicators = {
@@ -261,64 +395,79 @@ class EconomicDataCollector:
             'manufacturing_pmi': 'NAPM',
             'consumer_confidence': 'UMCSENT'
         }
-    
-    async def fetch_economic_data(self, session: aiohttp.ClientSession) -> List[Dict]:
-        """Fetch economic indicators"""
-        try:
-            economic_data = []
-            
-            for indicator_name, series_id in self.indicators.items():
-                url = f"{self.fred_base_url}/series/observations"
-                params = {
+        self.daily_series = {'DTWEXBGS', 'DCOILWTICO', 'BDIY'}
+        self.observations_url = f"{self.fred_base_url}/series/observations"
+        
+        # Query parameters are built once here and reused by every fetch.
+        # Monthly and quarterly series change far less often than the daily market ones.
+        self.series = tuple(
+            EconomicSeries(
+                indicator=indicator_name,
+                series_id=series_id,
+                params={
                     'series_id': series_id,
                     'api_key': self.fred_api_key,
                     'file_type': 'json',
                     'limit': 12,  # Last 12 observations
                     'sort_order': 'desc'
-                }
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        observations = data.get('observations', [])
-                        
-                        if observations:
-                            latest = observations[0]
-                            trend_data = self._calculate_trend(observations)
-                            
-                            processed_data = {
-                                'indicator': indicator_name,
-                                'series_id': series_id,
-                                'latest_value': float(latest['value']) if latest['value'] != '.' else None,
-                                'date': latest['date'],
-                                'trend': trend_data,
-                                'impact_assessment': self._assess_economic_impact(indicator_name, trend_data),
-                                'timestamp': datetime.now().isoformat()
-                            }
-                            economic_data.append(processed_data)
-                
-                # Rate limiting for FRED API
-                await asyncio.sleep(0.1)
+                },
+                cache_ttl=3600 if series_id in self.daily_series else 86400
+            )
+            for indicator_name, series_id in self.indicators.items()
+        )
+    
+    async def fetch_economic_data(self, session: aiohttp.ClientSession) -> List[Dict]:
+        """Fetch economic indicators"""
+        try:
+            # Fetch every indicator concurrently within the FRED rate limit, stamped with one batch timestamp
+            timestamp = datetime.now().isoformat()
+            results = await asyncio.gather(
+                *(self._fetch_indicator(session, series, timestamp) for series in self.series)
+            )
             
-            return economic_data
+            return [processed_data for processed_data in results if processed_data]
             
         except Exception as e:
             logger.error(f"Error fetching economic data: {e}")
             return []
     
+    async def _fetch_indicator(self, session: aiohttp.ClientSession, series: EconomicSeries, timestamp: str) -> Optional[Dict]:
+        """Fetch recent observations for one FRED series"""
+        data = await fetch_json(session, self.observations_url, series.params, self.limiter, self.semaphore,
+                                cache_ttl=series.cache_ttl)
+        if data is None:
+            return None
+        
+        observations = data.get('observations', [])
+        if not observations:
+            return None
+        
+        latest = observations[0]
+        trend_data = self._calculate_trend(observations)
+        
+        return {
+            'indicator': series.indicator,
+            'series_id': series.series_id,
+            'latest_value': float(latest['value']) if latest['value'] != '.' else None,
+            'date': latest['date'],
+            'trend': trend_data,
+            'impact_assessment': self._assess_economic_impact(series.indicator, trend_data),
+            'timestamp': timestamp
+        }
+    
     def _calculate_trend(self, observations: List[Dict]) -> Dict:
         """Calculate trend from historical observations"""
-        values = []
-        for obs in observations:
-            if obs['value'] != '.':
-                values.append(float(obs['value']))
+        values = [float(obs['value']) for obs in observations if obs['value'] != '.']
         
-        if len(values) < 2:
+        # Compare the latest three observations with the three before them
+        recent = values[:3]
+        older = values[3:6]
+        if not older:
             return {'direction': 'unknown', 'magnitude': 0, 'volatility': 'unknown'}
         
         # Simple trend calculation
-        recent_avg = sum(values[:3]) / min(3, len(values))
-        older_avg = sum(values[3:6]) / min(3, len(values[3:]))
+        recent_avg = sum(recent) / len(recent)
+        older_avg = sum(older) / len(older)
         
         if older_avg == 0:
             change_pct = 0
@@ -328,10 +477,7 @@ class EconomicDataCollector:
         direction = 'increasing' if change_pct > 1 else 'decreasing' if change_pct < -1 else 'stable'
         
         # Calculate volatility
-        if len(values) >= 3:
-            volatility = 'high' if max(values[:3]) - min(values[:3]) > recent_avg * 0.1 else 'low'
-        else:
-            volatility = 'unknown'
+        volatility = 'high' if max(recent) - min(recent) > recent_avg * 0.1 else 'low'
         
         return {
             'direction': direction,
@@ -391,44 +537,48 @@ class ShippingDataCollector:
             {'name': 'Singapore', 'area_id': 'SGSIN'},
             {'name': 'Rotterdam', 'area_id': 'NLRTM'}
         ]
+        
+        # The simulated figures depend only on the port name, so they are computed once
+        self.port_snapshots = [self._simulate_port(port) for port in self.major_ports]
     
     async def fetch_shipping_data(self, session: aiohttp.ClientSession) -> List[Dict]:
         """Fetch shipping and port data"""
         try:
-            shipping_data = []
-            
             # For demo purposes, we'll simulate shipping data
             # In production, you would use actual Marine Traffic API calls
-            for port in self.major_ports:
-                simulated_data = {
-                    'port_name': port['name'],
-                    'port_code': port['area_id'],
-                    'vessel_count': {
-                        'total': 150 + hash(port['name']) % 100,
-                        'cargo_ships': 80 + hash(port['name']) % 50,
-                        'container_ships': 40 + hash(port['name']) % 30,
-                        'tankers': 30 + hash(port['name']) % 20
-                    },
-                    'congestion_level': self._calculate_congestion_level(port['name']),
-                    'average_wait_time': 2.5 + (hash(port['name']) % 10) / 2,  # hours
-                    'berth_utilization': 0.75 + (hash(port['name']) % 25) / 100,
-                    'recent_arrivals': 25 + hash(port['name']) % 15,
-                    'recent_departures': 22 + hash(port['name']) % 12,
-                    'risk_assessment': self._assess_port_risk(port['name']),
-                    'timestamp': datetime.now().isoformat()
-                }
-                shipping_data.append(simulated_data)
-            
-            return shipping_data
+            timestamp = datetime.now().isoformat()
+            return [{**snapshot, 'timestamp': timestamp} for snapshot in self.port_snapshots]
             
         except Exception as e:
             logger.error(f"Error fetching shipping data: {e}")
             return []
     
-    def _calculate_congestion_level(self, port_name: str) -> str:
+    def _simulate_port(self, port: Dict) -> Dict:
+        """Simulate vessel and congestion figures for a port"""
+        # CRC32 is stable across processes, unlike the salted built-in str hash
+        port_hash = zlib.crc32(port['name'].encode())
+        
+        return {
+            'port_name': port['name'],
+            'port_code': port['area_id'],
+            'vessel_count': {
+                'total': 150 + port_hash % 100,
+                'cargo_ships': 80 + port_hash % 50,
+                'container_ships': 40 + port_hash % 30,
+                'tankers': 30 + port_hash % 20
+            },
+            'congestion_level': self._calculate_congestion_level(port_hash),
+            'average_wait_time': 2.5 + (port_hash % 10) / 2,  # hours
+            'berth_utilization': 0.75 + (port_hash % 25) / 100,
+            'recent_arrivals': 25 + port_hash % 15,
+            'recent_departures': 22 + port_hash % 12,
+            'risk_assessment': self._assess_port_risk(port_hash)
+        }
+    
+    def _calculate_congestion_level(self, port_hash: int) -> str:
         """Calculate port congestion level"""
         # Simulate congestion based on port characteristics
-        congestion_score = hash(port_name) % 100
+        congestion_score = port_hash % 100
         
         if congestion_score > 80:
             return 'high'
@@ -437,9 +587,9 @@ class ShippingDataCollector:
         else:
             return 'low'
     
-    def _assess_port_risk(self, port_name: str) -> Dict:
+    def _assess_port_risk(self, port_hash: int) -> Dict:
         """Assess port-related supply chain risks"""
-        risk_score = hash(port_name) % 100
+        risk_score = port_hash % 100
         
         return {
             'congestion_risk': 'high' if risk_score > 70 else 'medium' if risk_score > 40 else 'low',
@@ -458,93 +608,135 @@ class DataSourcesOrchestrator:
         self.weather_collector = WeatherDataCollector(self.config.openweather_api_key)
         self.economic_collector = EconomicDataCollector(self.config.fred_api_key)
         self.shipping_collector = ShippingDataCollector(self.config.marine_traffic_api_key)
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        # One keep-alive pool per worker, so repeat calls to the same API skip the TCP/TLS handshake
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self.session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
     
     async def collect_all_data(self) -> Dict[str, Any]:
         """Collect data from all sources"""
-        async with aiohttp.ClientSession() as session:
-            try:
-                # Collect data from all sources concurrently
-                news_task = self.news_collector.fetch_supply_chain_news(session)
-                weather_task = self.weather_collector.fetch_weather_data(session)
-                economic_task = self.economic_collector.fetch_economic_data(session)
-                shipping_task = self.shipping_collector.fetch_shipping_data(session)
-                
-                news_data, weather_data, economic_data, shipping_data = await asyncio.gather(
-                    news_task, weather_task, economic_task, shipping_task,
-                    return_exceptions=True
-                )
-                
-                # Handle any exceptions
-                if isinstance(news_data, Exception):
-                    logger.error(f"News data collection failed: {news_data}")
-                    news_data = []
-                
-                if isinstance(weather_data, Exception):
-                    logger.error(f"Weather data collection failed: {weather_data}")
-                    weather_data = []
-                
-                if isinstance(economic_data, Exception):
-                    logger.error(f"Economic data collection failed: {economic_data}")
-                    economic_data = []
-                
-                if isinstance(shipping_data, Exception):
-                    logger.error(f"Shipping data collection failed: {shipping_data}")
-                    shipping_data = []
-                
-                collected_data = {
-                    'news': news_data,
-                    'weather': weather_data,
-                    'economic': economic_data,
-                    'shipping': shipping_data,
-                    'collection_timestamp': datetime.now().isoformat(),
-                    'data_quality': self._assess_data_quality(news_data, weather_data, economic_data, shipping_data)
-                }
-                
-                # Store in Redis for caching
-                await self._cache_data(collected_data)
-                
-                # Publish to message queue for other services
-                await self._publish_data_update(collected_data)
-                
-                return collected_data
-                
-            except Exception as e:
-                logger.error(f"Error in data collection orchestration: {e}")
-                return {
-                    'news': [],
-                    'weather': [],
-                    'economic': [],
-                    'shipping': [],
-                    'collection_timestamp': datetime.now().isoformat(),
-                    'error': str(e)
-                }
+        session = self.get_session()
+        collected_at = datetime.now()
+        collection_timestamp = collected_at.isoformat()
+        try:
+            # Collect data from all sources concurrently
+            news_task = self.news_collector.fetch_supply_chain_news(session)
+            weather_task = self.weather_collector.fetch_weather_data(session)
+            economic_task = self.economic_collector.fetch_economic_data(session)
+            shipping_task = self.shipping_collector.fetch_shipping_data(session)
+            
+            news_data, weather_data, economic_data, shipping_data = await asyncio.gather(
+                news_task, weather_task, economic_task, shipping_task,
+                return_exceptions=True
+            )
+            
+            # Handle any exceptions
+            if isinstance(news_data, Exception):
+                logger.error(f"News data collection failed: {news_data}")
+                news_data = []
+            
+            if isinstance(weather_data, Exception):
+                logger.error(f"Weather data collection failed: {weather_data}")
+                weather_data = []
+            
+            if isinstance(economic_data, Exception):
+                logger.error(f"Economic data collection failed: {economic_data}")
+                economic_data = []
+            
+            if isinstance(shipping_data, Exception):
+                logger.error(f"Shipping data collection failed: {shipping_data}")
+                shipping_data = []
+            
+            collected_data = {
+                'news': news_data,
+                'weather': weather_data,
+                'economic': economic_data,
+                'shipping': shipping_data,
+                'collection_timestamp': collection_timestamp,
+                'data_quality': self._assess_data_quality(news_data, weather_data, economic_data, shipping_data)
+            }
+            
+            # Store in Redis for caching
+            await self._cache_data(collected_data, collected_at)
+            
+            # Publish to message queue for other services
+            await self._publish_data_update(collected_data, collection_timestamp)
+            
+            return collected_data
+            
+        except Exception as e:
+            logger.error(f"Error in data collection orchestration: {e}")
+            return {
+                'news': [],
+                'weather': [],
+                'economic': [],
+                'shipping': [],
+                'collection_timestamp': collection_timestamp,
+                'error': str(e)
+            }
     
     def _assess_data_quality(self, news_data: List, weather_data: List, economic_data: List, shipping_data: List) -> Dict:
         """Assess the quality and completeness of collected data"""
+        counts = (len(news_data), len(weather_data), len(economic_data), len(shipping_data))
         return {
-            'news_data_points': len(news_data),
-            'weather_data_points': len(weather_data),
-            'economic_data_points': len(economic_data),
-            'shipping_data_points': len(shipping_data),
-            'completeness_score': min(100, (len(news_data) + len(weather_data) + len(economic_data) + len(shipping_data)) / 4 * 10),
+            'news_data_points': counts[0],
+            'weather_data_points': counts[1],
+            'economic_data_points': counts[2],
+            'shipping_data_points': counts[3],
+            'completeness_score': min(100, sum(counts) / 4 * 10),
             'freshness': 'current'  # Data is collected in real-time
         }
     
-    async def _cache_data(self, data: Dict):
+    async def _cache_data(self, data: Dict, collected_at: datetime):
         """Cache collected data in Redis"""
         try:
-            cache_key = f"external_data:{datetime.now().strftime('%Y%m%d_%H')}"
-            redis_client.set(cache_key, json.dumps(data), ex=3600)  # Cache for 1 hour
+            hour = collected_at.strftime('%Y%m%d_%H')
+            cache_key = f"external_data:{hour}"
+            
+            # Each source is encoded once; the aggregate is spliced from the same bytes
+            source_payloads = {source: orjson.dumps(data.get(source, []), default=str) for source in SOURCE_CACHE_TTLS}
+            metadata = orjson.dumps({k: v for k, v in data.items() if k not in SOURCE_CACHE_TTLS}, default=str)
+            fields = [b'"%s":%s' % (source.encode(), payload) for source, payload in source_payloads.items()]
+            if metadata != b'{}':
+                fields.append(metadata[1:-1])
+            
+            entries = [(f"external_data:{source}:{hour}", payload, SOURCE_CACHE_TTLS[source])
+                       for source, payload in source_payloads.items()]
+            
+            # Also refresh the latest copies served by the /collect endpoints, skipping failed sources
+            collected_at = orjson.dumps(time.time())
+            entries.extend(
+                (f"collected_data:{source}", b'{"collected_at":%s,"data":%s}' % (collected_at, payload),
+                 SOURCE_CACHE_TTLS[source] + STALE_CACHE_TTL)
+                for source, payload in source_payloads.items() if data.get(source)
+            )
+            entries.append((cache_key, b'{' + b','.join(fields) + b'}', 3600))  # Cache for 1 hour
+            
+            # All keys go out in one pipelined round-trip
+            await asyncio.to_thread(redis_client.set_many, entries)
             logger.info(f"Data cached with key: {cache_key}")
         except Exception as e:
             logger.error(f"Error caching data: {e}")
     
-    async def _publish_data_update(self, data: Dict):
+    async def _publish_data_update(self, data: Dict, timestamp: str):
         """Publish data update to message queue"""
         try:
             message = {
                 'event_type': 'external_data_update',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'data_summary': {
                     'news_articles': len(data.get('news', [])),
                     'weather_locations': len(data.get('weather', [])),
@@ -553,10 +745,12 @@ class DataSourcesOrchestrator:
                 }
             }
             
-            message_queue.publish_message(
-                exchange=Exchanges.EVENTS,
-                routing_key='data.external.update',
-                message=message
+            # The pika channel blocks, so the publish runs in a worker thread
+            await asyncio.to_thread(
+                message_queue.publish_event,
+                Exchanges.SUPPLY_CHAIN_EVENTS,
+                'data.external.update',
+                orjson.dumps(message)
             )
             logger.info("Published external data update event")
         except Exception as e:
@@ -565,6 +759,49 @@ class DataSourcesOrchestrator:
 # Initialize orchestrator
 data_orchestrator = DataSourcesOrchestrator()
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared HTTP session"""
+    await data_orchestrator.close()
+
+async def get_source_data(source: str, collect: Callable[[], Awaitable[List[Dict]]],
+                          background_tasks: BackgroundTasks) -> Tuple[List[Dict], str]:
+    """Return a source's latest collection, refreshing stale copies in the background
+    
+    The second element reports whether the data was fresh from cache, stale, or just collected.
+    """
+    cache_key = f"collected_data:{source}"
+    raw = await asyncio.to_thread(redis_client.get_raw, cache_key)
+    
+    if raw:
+        entry = orjson.loads(raw)
+        if time.time() - entry['collected_at'] < SOURCE_CACHE_TTLS[source]:
+            return entry['data'], "cache"
+        
+        # Serve the stale copy now; one worker refreshes it after the response is sent
+        background_tasks.add_task(refresh_source_data, source, collect)
+        return entry['data'], "stale"
+    
+    data = await collect()
+    await store_source_data(source, data)
+    return data, "collected"
+
+async def refresh_source_data(source: str, collect: Callable[[], Awaitable[List[Dict]]]):
+    """Re-collect a source unless another worker is already doing so"""
+    if await asyncio.to_thread(redis_client.acquire_lock, f"collected_data:{source}:refresh", REFRESH_LOCK_TTL):
+        await store_source_data(source, await collect())
+
+async def store_source_data(source: str, data: List[Dict]):
+    """Cache a source's collection for reuse by the /collect endpoints"""
+    # Collectors return an empty list on failure, which should not replace good data
+    if not data:
+        return
+    
+    entry = orjson.dumps({'collected_at': time.time(), 'data': data}, default=str)
+    await asyncio.to_thread(
+        redis_client.set_many, [(f"collected_data:{source}", entry, SOURCE_CACHE_TTLS[source] + STALE_CACHE_TTL)]
+    )
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -586,16 +823,20 @@ async def collect_all_data(background_tasks: BackgroundTasks):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/collect/news")
-async def collect_news_data():
+async def collect_news_data(background_tasks: BackgroundTasks):
     """Collect only news data"""
     try:
-        async with aiohttp.ClientSession() as session:
-            news_data = await data_orchestrator.news_collector.fetch_supply_chain_news(session)
+        news_data, cache_status = await get_source_data(
+            "news",
+            lambda: data_orchestrator.news_collector.fetch_supply_chain_news(data_orchestrator.get_session()),
+            background_tasks
+        )
         
         return {
             "status": "success",
             "data": news_data,
             "count": len(news_data),
+            "cache": cache_status,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -603,16 +844,20 @@ async def collect_news_data():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/collect/weather")
-async def collect_weather_data():
+async def collect_weather_data(background_tasks: BackgroundTasks):
     """Collect only weather data"""
     try:
-        async with aiohttp.ClientSession() as session:
-            weather_data = await data_orchestrator.weather_collector.fetch_weather_data(session)
+        weather_data, cache_status = await get_source_data(
+            "weather",
+            lambda: data_orchestrator.weather_collector.fetch_weather_data(data_orchestrator.get_session()),
+            background_tasks
+        )
         
         return {
             "status": "success",
             "data": weather_data,
             "count": len(weather_data),
+            "cache": cache_status,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -620,16 +865,20 @@ async def collect_weather_data():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/collect/economic")
-async def collect_economic_data():
+async def collect_economic_data(background_tasks: BackgroundTasks):
     """Collect only economic data"""
     try:
-        async with aiohttp.ClientSession() as session:
-            economic_data = await data_orchestrator.economic_collector.fetch_economic_data(session)
+        economic_data, cache_status = await get_source_data(
+            "economic",
+            lambda: data_orchestrator.economic_collector.fetch_economic_data(data_orchestrator.get_session()),
+            background_tasks
+        )
         
         return {
             "status": "success",
             "data": economic_data,
             "count": len(economic_data),
+            "cache": cache_status,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -637,16 +886,20 @@ async def collect_economic_data():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/collect/shipping")
-async def collect_shipping_data():
+async def collect_shipping_data(background_tasks: BackgroundTasks):
     """Collect only shipping data"""
     try:
-        async with aiohttp.ClientSession() as session:
-            shipping_data = await data_orchestrator.shipping_collector.fetch_shipping_data(session)
+        shipping_data, cache_status = await get_source_data(
+            "shipping",
+            lambda: data_orchestrator.shipping_collector.fetch_shipping_data(data_orchestrator.get_session()),
+            background_tasks
+        )
         
         return {
             "status": "success",
             "data": shipping_data,
             "count": len(shipping_data),
+            "cache": cache_status,
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -654,16 +907,20 @@ async def collect_shipping_data():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/data/cached")
-async def get_cached_data():
-    """Retrieve cached external data"""
+async def get_cached_data(source: Optional[str] = None):
+    """Retrieve cached external data, optionally for a single source"""
+    if source is not None and source not in SOURCE_CACHE_TTLS:
+        raise HTTPException(status_code=404, detail=f"Unknown data source: {source}")
+    
     try:
-        cache_key = f"external_data:{datetime.now().strftime('%Y%m%d_%H')}"
-        cached_data = redis_client.get(cache_key)
+        hour = datetime.now().strftime('%Y%m%d_%H')
+        cache_key = f"external_data:{source}:{hour}" if source else f"external_data:{hour}"
+        cached_data = await asyncio.to_thread(redis_client.get_raw, cache_key)
         
         if cached_data:
             return {
                 "status": "success",
-                "data": json.loads(cached_data),
+                "data": orjson.loads(cached_data),
                 "source": "cache"
             }
         else:
@@ -677,4 +934,4 @@ async def get_cached_data():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8005)
+    uvicorn.run(app, host="0.0.0.0", port=8005, loop="uvloop", http="httptools")
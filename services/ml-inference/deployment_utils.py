@@ -6,7 +6,6 @@ Includes:
 - A/B testing framework
 """
 
-import mlflow
 import pandas as pd
 from typing import Any, Dict
 import logging
@@ -16,6 +15,9 @@ def log_model_with_mlflow(model: Any, params: Dict[str, Any], metrics: Dict[str,
     """
     Log model, parameters, and metrics to MLflow.
     """
+    # MLflow takes seconds to import and is only needed when a run is logged
+    import mlflow
+    
     with mlflow.start_run():
         mlflow.log_params(params)
         mlflow.log_metrics(metrics)
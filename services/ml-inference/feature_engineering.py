@@ -43,20 +43,39 @@ def map_weather_to_routes(weather_events: pd.DataFrame, routes: pd.DataFrame, hu
 def add_economic_indicators(df: pd.DataFrame, indicator_cols: List[str], window: int = 7) -> pd.DataFrame:
     """
     Add derivatives, moving averages, and volatility for economic indicators.
+    Each statistic is computed for all columns in one rolling pass and joined in a single concat.
     """
-    for col in indicator_cols:
-        df[f"{col}_ma{window}"] = df[col].rolling(window).mean()
-        df[f"{col}_vol{window}"] = df[col].rolling(window).std()
-        df[f"{col}_deriv"] = df[col].diff()
-    return df
+    values = df[indicator_cols]
+    rolling = values.rolling(window)
+    features = {
+        f"_ma{window}": rolling.mean(),
+        f"_vol{window}": rolling.std(),
+        "_deriv": values.diff()
+    }
+    return _join_features(df, indicator_cols, features)
 
 # --- Time-based Aggregations ---
 def add_time_rolling_features(df: pd.DataFrame, cols: List[str], window: int = 7) -> pd.DataFrame:
     """
     Create rolling windows and trend indicators for selected columns.
+    Each statistic is computed for all columns in one rolling pass and joined in a single concat.
     """
-    for col in cols:
-        df[f"{col}_trend"] = df[col].diff(periods=window)
-        df[f"{col}_rolling_min{window}"] = df[col].rolling(window).min()
-        df[f"{col}_rolling_max{window}"] = df[col].rolling(window).max()
-    return df
+    values = df[cols]
+    rolling = values.rolling(window)
+    features = {
+        "_trend": values.diff(periods=window),
+        f"_rolling_min{window}": rolling.min(),
+        f"_rolling_max{window}": rolling.max()
+    }
+    return _join_features(df, cols, features)
+
+def _join_features(df: pd.DataFrame, cols: List[str], features: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Append suffixed feature frames to df, ordered column by column.
+    """
+    new_columns = {
+        f"{col}{suffix}": frame[col]
+        for col in cols
+        for suffix, frame in features.items()
+    }
+    return pd.concat([df, pd.DataFrame(new_columns, index=df.index)], axis=1)
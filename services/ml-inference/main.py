@@ -2,19 +2,27 @@
 ML Inference Service - AI analysis and predictions
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 import numpy as np
 import pandas as pd
+import sklearn
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler
 import joblib
 import logging
 from datetime import datetime, timedelta
-import json
+import orjson
 import hashlib
+import re
 import sys
 import os
-from typing import Dict, Any, List
+import fcntl
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Literal, Optional, Tuple
+from pydantic import BaseModel, Field
+import asyncio
 
 # Add shared modules to path
 sys.path.append('/app/shared')
@@ -28,16 +36,119 @@ from message_queue import MessageQueue, EventTypes, Exchanges
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="ML Inference Service", version="1.0.0")
+# Model inputs come from our own feature extractors, so skip sklearn's per-call NaN/inf scan
+sklearn.set_config(assume_finite=True)
+
+app = FastAPI(title="ML Inference Service", version="1.0.0", default_response_class=ORJSONResponse)
+
+DURATION_MAPPING = {
+    0: {"days": "1-7", "category": "short"},
+    1: {"days": "8-30", "category": "medium"},
+    2: {"days": "31-90", "category": "long"},
+    3: {"days": "90+", "category": "extended"}
+}
+
+# Concurrent /predict calls of one type are coalesced for up to this long, or this many requests
+PREDICTION_BATCH_WINDOW = 0.008
+MAX_PREDICTION_BATCH = 32
+
+# Trained models are saved here once and loaded on later starts instead of retraining
+MODEL_DIR = os.getenv("MODEL_DIR", "/app/models")
+
+HIGH_RISK_LOCATIONS = ("taiwan", "china", "suez canal", "panama canal", "gulf of mexico")
+HIGH_VULNERABILITY_SECTORS = frozenset({"electronics", "automotive", "pharmaceuticals", "energy"})
+
+EVENT_TYPE_SCORES = {
+    "weather": 0.7,
+    "economic": 0.5,
+    "news": 0.6,
+    "geopolitical": 0.8
+}
+
+# One scan of the location string finds any high-risk location it mentions
+_HIGH_RISK_LOCATION_RE = re.compile("|".join(map(re.escape, HIGH_RISK_LOCATIONS)))
+
+class EventData(BaseModel):
+    """Event attributes the models score; other fields sent with an event are ignored"""
+    severity: float = 0.5
+    location: str = ""
+    impact_sectors: List[str] = []
+    event_type: str = ""
+
+class BusinessProfile(BaseModel):
+    """Business attributes used to tailor an impact analysis"""
+    industry: str = ""
+    supply_regions: List[str] = []
+    critical_materials: List[str] = []
+    key_suppliers: List[str] = []
+
+class PredictionRequest(BaseModel):
+    """Body of a /predict request"""
+    type: Literal["risk", "impact", "duration", "business_impact"] = "risk"
+    event_data: EventData = Field(default_factory=EventData)
+    business_profile: BusinessProfile = Field(default_factory=BusinessProfile)
+
+class BusinessImpactRequest(BaseModel):
+    """Body of an /analyze/business-impact request"""
+    business_profile: BusinessProfile
+    event_data: EventData
 
 # Initialize clients
 redis_client = RedisClient()
 message_queue = MessageQueue()
 
+class CompiledForest:
+    """A fitted random forest flattened into contiguous node arrays
+    
+    sklearn walks the trees one Python call at a time; here every tree advances one level
+    per step as a single vectorized operation, with leaves pointing at themselves.
+    """
+    
+    def __init__(self, forest: RandomForestClassifier):
+        trees = [estimator.tree_ for estimator in forest.estimators_]
+        offsets = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+        
+        left, right, feature, threshold, value = [], [], [], [], []
+        for tree, offset in zip(trees, offsets):
+            is_leaf = tree.children_left == -1
+            nodes = np.arange(tree.node_count) + offset
+            left.append(np.where(is_leaf, nodes, tree.children_left + offset))
+            right.append(np.where(is_leaf, nodes, tree.children_right + offset))
+            feature.append(np.where(is_leaf, 0, tree.feature))
+            threshold.append(tree.threshold)
+            # Per-node class counts become the class probabilities a tree reports at that leaf
+            counts = tree.value[:, 0, :]
+            value.append(counts / counts.sum(axis=1, keepdims=True))
+        
+        self.roots = offsets
+        self.depth = max(tree.max_depth for tree in trees)
+        self.left = np.concatenate(left)
+        self.right = np.concatenate(right)
+        self.feature = np.concatenate(feature)
+        self.threshold = np.concatenate(threshold)
+        self.value = np.concatenate(value)
+        self.classes_ = forest.classes_
+    
+    def predict_proba(self, X) -> np.ndarray:
+        """Average the leaf class probabilities of every tree, as RandomForestClassifier does"""
+        # Trees split on float32 inputs, so compare the same rounded values sklearn does
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(len(X))[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return self.value[nodes].mean(axis=1)
+
 class MLInferenceEngine:
     def __init__(self):
         self.models = {}
         self.scalers = {}
+        self.fast_predictors = {}
+        self.scaler_params = {}
+        self._scratch = threading.local()
+        # Events keep naming the same few locations, so their scores are memoized per instance
+        self._get_location_risk_score = lru_cache(maxsize=4096)(self._get_location_risk_score)
         self.initialize_models()
     
     def initialize_models(self):
@@ -66,8 +177,21 @@ class MLInferenceEngine:
             self.scalers['impact_scaler'] = StandardScaler()
             self.scalers['duration_scaler'] = StandardScaler()
             
-            # Train models with mock data (in production, load pre-trained models)
-            self._train_mock_models()
+            # Processes starting together on the same MODEL_DIR queue on the lock, so only the first one trains
+            os.makedirs(MODEL_DIR, exist_ok=True)
+            with open(os.path.join(MODEL_DIR, ".lock"), "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                if not self._load_models():
+                    # Train models with mock data (in production, load pre-trained models)
+                    self._train_mock_models()
+                    self._save_models()
+            
+            # Flatten the forests for serving; the boosted model already predicts in compiled code
+            self.fast_predictors['risk'] = CompiledForest(self.models['risk_predictor'])
+            self.fast_predictors['duration'] = CompiledForest(self.models['duration_predictor'])
+            
+            # Keep the fitted statistics so serving can standardize without sklearn's input validation
+            self.scaler_params = {name: (scaler.mean_, scaler.scale_) for name, scaler in self.scalers.items()}
             
             logger.info("ML models initialized successfully")
             
@@ -82,15 +206,16 @@ class MLInferenceEngine:
             np.random.seed(42)
             n_samples = 1000
             
+            # Trees split on float32 internally, so generating float32 up front avoids a converted copy per fit
             # Features: severity, location_risk, sector_vulnerability, economic_indicator
-            X_risk = np.random.rand(n_samples, 4)
-            y_risk = (X_risk[:, 0] * 0.4 + X_risk[:, 1] * 0.3 + X_risk[:, 2] * 0.2 + X_risk[:, 3] * 0.1 > 0.5).astype(int)
+            X_risk = np.random.rand(n_samples, 4).astype(np.float32)
+            y_risk = (X_risk[:, 0] * 0.4 + X_risk[:, 1] * 0.3 + X_risk[:, 2] * 0.2 + X_risk[:, 3] * 0.1 > 0.5).astype(np.int8)
             
-            X_impact = np.random.rand(n_samples, 5)
+            X_impact = np.random.rand(n_samples, 5).astype(np.float32)
             y_impact = X_impact[:, 0] * 0.3 + X_impact[:, 1] * 0.25 + X_impact[:, 2] * 0.2 + X_impact[:, 3] * 0.15 + X_impact[:, 4] * 0.1
             
-            X_duration = np.random.rand(n_samples, 4)
-            y_duration = ((X_duration[:, 0] + X_duration[:, 1]) * 2).astype(int) % 4  # 0-3 classes
+            X_duration = np.random.rand(n_samples, 4).astype(np.float32)
+            y_duration = ((X_duration[:, 0] + X_duration[:, 1]) * 2).astype(np.int8) % 4  # 0-3 classes
             
             # Train models
             self.models['risk_predictor'].fit(X_risk, y_risk)
@@ -108,98 +233,172 @@ class MLInferenceEngine:
             logger.error(f"Error training mock models: {e}")
             raise
     
-    def predict_risk(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _model_paths(self) -> Dict[str, str]:
+        """Artifact path for every model and scaler"""
+        return {name: os.path.join(MODEL_DIR, f"{name}.joblib") for name in [*self.models, *self.scalers]}
+    
+    def _load_models(self) -> bool:
+        """Load previously saved models and scalers; returns False if any are missing"""
+        paths = self._model_paths()
+        if not all(os.path.exists(path) for path in paths.values()):
+            return False
+        
+        try:
+            for name, path in paths.items():
+                target = self.models if name in self.models else self.scalers
+                target[name] = joblib.load(path)
+            logger.info(f"Loaded saved models from {MODEL_DIR}")
+            return True
+        except Exception as e:
+            logger.error(f"Error loading saved models, retraining: {e}")
+            return False
+    
+    def _save_models(self):
+        """Save the trained models and scalers for other processes and restarts"""
+        try:
+            for name, path in self._model_paths().items():
+                estimator = self.models[name] if name in self.models else self.scalers[name]
+                # Written aside and renamed so a reader never sees a partial file
+                joblib.dump(estimator, f"{path}.tmp")
+                os.replace(f"{path}.tmp", path)
+        except Exception as e:
+            logger.error(f"Error saving models: {e}")
+    
+    def predict_risk(self, event_data: EventData) -> Dict[str, Any]:
         """Predict risk level for an event"""
+        return self.predict_risk_batch([event_data])[0]
+    
+    def predict_risk_batch(self, events: List[EventData],
+                           features: Optional[List[List[float]]] = None) -> List[Dict[str, Any]]:
+        """Predict risk levels for several events with one model call"""
         try:
-            # Extract features from event data
-            features = self._extract_risk_features(event_data)
-            features_scaled = self.scalers['risk_scaler'].transform([features])
+            # Extract features from event data unless the caller already has them
+            if features is None:
+                features = [self._extract_risk_features(event_data) for event_data in events]
+            features_scaled = self._scale('risk_scaler', features)
             
-            # Make prediction
-            risk_prob = self.models['risk_predictor'].predict_proba(features_scaled)[0]
-            risk_prediction = self.models['risk_predictor'].predict(features_scaled)[0]
+            # Make prediction; the class label is the most probable class, so one call gives both
+            model = self.fast_predictors['risk']
+            risk_probs = model.predict_proba(features_scaled)
+            risk_predictions = model.classes_[risk_probs.argmax(axis=1)]
             
-            return {
-                "risk_level": float(risk_prob[1]),  # Probability of high risk
-                "risk_category": "high" if risk_prediction == 1 else "low",
-                "confidence": float(max(risk_prob)),
-                "features_used": features
-            }
+            return [
+                {
+                    "risk_level": float(risk_prob[1]),  # Probability of high risk
+                    "risk_category": "high" if risk_prediction == 1 else "low",
+                    "confidence": float(max(risk_prob)),
+                    "features_used": event_features
+                }
+                for event_features, risk_prob, risk_prediction in zip(features, risk_probs, risk_predictions)
+            ]
             
         except Exception as e:
             logger.error(f"Error predicting risk: {e}")
             raise
     
-    def predict_impact(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+    def predict_impact(self, event_data: EventData) -> Dict[str, Any]:
         """Predict impact severity"""
+        return self.predict_impact_batch([event_data])[0]
+    
+    def predict_impact_batch(self, events: List[EventData],
+                             features: Optional[List[List[float]]] = None) -> List[Dict[str, Any]]:
+        """Predict impact severity for several events with one model call"""
         try:
-            # Extract features from event data
-            features = self._extract_impact_features(event_data)
-            features_scaled = self.scalers['impact_scaler'].transform([features])
+            # Extract features from event data unless the caller already has them
+            if features is None:
+                features = [self._extract_impact_features(event_data) for event_data in events]
+            features_scaled = self._scale('impact_scaler', features)
             
             # Make prediction
-            impact_score = self.models['impact_predictor'].predict(features_scaled)[0]
+            impact_scores = self.models['impact_predictor'].predict(features_scaled)
             
-            return {
-                "impact_score": float(max(0, min(1, impact_score))),  # Clamp to 0-1
-                "impact_category": self._categorize_impact(impact_score),
-                "affected_sectors": self._predict_affected_sectors(event_data),
-                "features_used": features
-            }
+            return [
+                {
+                    "impact_score": float(max(0, min(1, impact_score))),  # Clamp to 0-1
+                    "impact_category": self._categorize_impact(impact_score),
+                    "affected_sectors": self._predict_affected_sectors(event_data),
+                    "features_used": event_features
+                }
+                for event_data, event_features, impact_score in zip(events, features, impact_scores)
+            ]
             
         except Exception as e:
             logger.error(f"Error predicting impact: {e}")
             raise
     
-    def predict_duration(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+    def predict_duration(self, event_data: EventData) -> Dict[str, Any]:
         """Predict disruption duration"""
+        return self.predict_duration_batch([event_data])[0]
+    
+    def predict_duration_batch(self, events: List[EventData],
+                               features: Optional[List[List[float]]] = None) -> List[Dict[str, Any]]:
+        """Predict disruption durations for several events with one model call"""
         try:
-            # Extract features from event data
-            features = self._extract_duration_features(event_data)
-            features_scaled = self.scalers['duration_scaler'].transform([features])
+            # Extract features from event data unless the caller already has them
+            if features is None:
+                features = [self._extract_duration_features(event_data) for event_data in events]
+            features_scaled = self._scale('duration_scaler', features)
             
-            # Make prediction
-            duration_class = self.models['duration_predictor'].predict(features_scaled)[0]
-            duration_prob = self.models['duration_predictor'].predict_proba(features_scaled)[0]
-            
-            duration_mapping = {
-                0: {"days": "1-7", "category": "short"},
-                1: {"days": "8-30", "category": "medium"},
-                2: {"days": "31-90", "category": "long"},
-                3: {"days": "90+", "category": "extended"}
-            }
+            # Make prediction; the class label is the most probable class, so one call gives both
+            model = self.fast_predictors['duration']
+            duration_probs = model.predict_proba(features_scaled)
+            duration_classes = model.classes_[duration_probs.argmax(axis=1)]
             
-            return {
-                "duration_class": int(duration_class),
-                "duration_range": duration_mapping[duration_class]["days"],
-                "duration_category": duration_mapping[duration_class]["category"],
-                "confidence": float(max(duration_prob)),
-                "features_used": features
-            }
+            return [
+                {
+                    "duration_class": int(duration_class),
+                    "duration_range": DURATION_MAPPING[duration_class]["days"],
+                    "duration_category": DURATION_MAPPING[duration_class]["category"],
+                    "confidence": float(max(duration_prob)),
+                    "features_used": event_features
+                }
+                for event_features, duration_prob, duration_class in zip(features, duration_probs, duration_classes)
+            ]
             
         except Exception as e:
             logger.error(f"Error predicting duration: {e}")
             raise
     
-    def analyze_business_impact(self, business_profile: Dict[str, Any], event_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _scale(self, scaler_name: str, features: List[List[float]]) -> np.ndarray:
+        """Standardize feature rows exactly as the fitted StandardScaler would
+        
+        The result is written into a per-thread scratch buffer sized for a full batch, so it is
+        only valid until the next call on the same thread; the models copy it on input.
+        """
+        mean, scale = self.scaler_params[scaler_name]
+        buffers = getattr(self._scratch, "buffers", None)
+        if buffers is None:
+            buffers = self._scratch.buffers = {}
+        buffer = buffers.get(scaler_name)
+        if buffer is None:
+            buffer = buffers[scaler_name] = np.empty((MAX_PREDICTION_BATCH, len(mean)))
+        
+        rows = len(features)
+        scaled = buffer[:rows] if rows <= len(buffer) else np.empty((rows, len(mean)))
+        np.subtract(features, mean, out=scaled)
+        np.divide(scaled, scale, out=scaled)
+        return scaled
+    
+    def analyze_business_impact(self, business_profile: BusinessProfile, event_data: EventData) -> Dict[str, Any]:
         """Analyze impact on specific business"""
         try:
             # Calculate business-specific risk factors
-            supply_regions = business_profile.get("supply_regions", [])
-            critical_materials = business_profile.get("critical_materials", [])
-            key_suppliers = business_profile.get("key_suppliers", [])
+            supply_regions = business_profile.supply_regions
+            critical_materials = business_profile.critical_materials
+            key_suppliers = business_profile.key_suppliers
             
-            event_location = event_data.get("location", "")
-            event_sectors = event_data.get("impact_sectors", [])
+            event_location = event_data.location
+            event_sectors = event_data.impact_sectors
             
             # Calculate overlap scores
             region_overlap = self._calculate_region_overlap(supply_regions, event_location)
-            sector_overlap = self._calculate_sector_overlap(business_profile.get("industry", ""), event_sectors)
+            sector_overlap = self._calculate_sector_overlap(business_profile.industry, event_sectors)
             
-            # Base predictions
-            risk_pred = self.predict_risk(event_data)
-            impact_pred = self.predict_impact(event_data)
-            duration_pred = self.predict_duration(event_data)
+            # Base predictions, with the scores shared by all three models computed once
+            risk_features, impact_features, duration_features = self._extract_all_features(event_data)
+            risk_pred = self.predict_risk_batch([event_data], [risk_features])[0]
+            impact_pred = self.predict_impact_batch([event_data], [impact_features])[0]
+            duration_pred = self.predict_duration_batch([event_data], [duration_features])[0]
             
             # Adjust for business-specific factors
             business_risk = risk_pred["risk_level"] * (1 + region_overlap * 0.5 + sector_overlap * 0.3)
@@ -219,7 +418,7 @@ class MLInferenceEngine:
                 "risk_factors": {
                     "supply_chain_exposure": region_overlap,
                     "industry_vulnerability": sector_overlap,
-                    "base_event_severity": event_data.get("severity", 0.5)
+                    "base_event_severity": event_data.severity
                 }
             }
             
@@ -227,60 +426,61 @@ class MLInferenceEngine:
             logger.error(f"Error analyzing business impact: {e}")
             raise
     
-    def _extract_risk_features(self, event_data: Dict[str, Any]) -> List[float]:
+    def _extract_risk_features(self, event_data: EventData) -> List[float]:
         """Extract features for risk prediction"""
         return [
-            event_data.get("severity", 0.5),
-            self._get_location_risk_score(event_data.get("location", "")),
-            self._get_sector_vulnerability_score(event_data.get("impact_sectors", [])),
+            event_data.severity,
+            self._get_location_risk_score(event_data.location),
+            self._get_sector_vulnerability_score(event_data.impact_sectors),
             self._get_economic_indicator_score()
         ]
     
-    def _extract_impact_features(self, event_data: Dict[str, Any]) -> List[float]:
+    def _extract_impact_features(self, event_data: EventData) -> List[float]:
         """Extract features for impact prediction"""
         return [
-            event_data.get("severity", 0.5),
-            self._get_location_risk_score(event_data.get("location", "")),
-            self._get_sector_vulnerability_score(event_data.get("impact_sectors", [])),
-            len(event_data.get("impact_sectors", [])) / 10.0,  # Normalized sector count
-            self._get_event_type_score(event_data.get("event_type", ""))
+            event_data.severity,
+            self._get_location_risk_score(event_data.location),
+            self._get_sector_vulnerability_score(event_data.impact_sectors),
+            len(event_data.impact_sectors) / 10.0,  # Normalized sector count
+            self._get_event_type_score(event_data.event_type)
         ]
     
-    def _extract_duration_features(self, event_data: Dict[str, Any]) -> List[float]:
+    def _extract_duration_features(self, event_data: EventData) -> List[float]:
         """Extract features for duration prediction"""
         return [
-            event_data.get("severity", 0.5),
-            self._get_event_type_score(event_data.get("event_type", "")),
-            self._get_location_risk_score(event_data.get("location", "")),
-            len(event_data.get("impact_sectors", [])) / 10.0
+            event_data.severity,
+            self._get_event_type_score(event_data.event_type),
+            self._get_location_risk_score(event_data.location),
+            len(event_data.impact_sectors) / 10.0
         ]
     
+    def _extract_all_features(self, event_data: EventData) -> Tuple[List[float], List[float], List[float]]:
+        """Extract the risk, impact and duration features together, scoring each event attribute once"""
+        severity = event_data.severity
+        location_risk = self._get_location_risk_score(event_data.location)
+        sectors = event_data.impact_sectors
+        sector_vulnerability = self._get_sector_vulnerability_score(sectors)
+        sector_count = len(sectors) / 10.0
+        event_type_score = self._get_event_type_score(event_data.event_type)
+        
+        return (
+            [severity, location_risk, sector_vulnerability, self._get_economic_indicator_score()],
+            [severity, location_risk, sector_vulnerability, sector_count, event_type_score],
+            [severity, event_type_score, location_risk, sector_count]
+        )
+    
     def _get_location_risk_score(self, location: str) -> float:
         """Get risk score based on location"""
-        high_risk_locations = ["taiwan", "china", "suez canal", "panama canal", "gulf of mexico"]
-        location_lower = location.lower()
-        
-        for high_risk in high_risk_locations:
-            if high_risk in location_lower:
-                return 0.8
-        
-        return 0.4
+        return 0.8 if _HIGH_RISK_LOCATION_RE.search(location.lower()) else 0.4
     
     def _get_sector_vulnerability_score(self, sectors: List[str]) -> float:
         """Get vulnerability score based on affected sectors"""
-        high_vulnerability_sectors = ["electronics", "automotive", "pharmaceuticals", "energy"]
-        
         if not sectors:
             return 0.5
         
-        vulnerability_scores = []
-        for sector in sectors:
-            if sector.lower() in high_vulnerability_sectors:
-                vulnerability_scores.append(0.8)
-            else:
-                vulnerability_scores.append(0.4)
-        
-        return sum(vulnerability_scores) / len(vulnerability_scores)
+        # Mean of 0.8 per high-vulnerability sector and 0.4 per other sector, without a score list
+        n_high = sum(1 for sector in sectors if sector.lower() in HIGH_VULNERABILITY_SECTORS)
+        return (0.8 * n_high + 0.4 * (len(sectors) - n_high)) / len(sectors)
     
     def _get_economic_indicator_score(self) -> float:
         """Get current economic indicator score"""
@@ -289,13 +489,7 @@ class MLInferenceEngine:
     
     def _get_event_type_score(self, event_type: str) -> float:
         """Get score based on event type"""
-        event_scores = {
-            "weather": 0.7,
-            "economic": 0.5,
-            "news": 0.6,
-            "geopolitical": 0.8
-        }
-        return event_scores.get(event_type.lower(), 0.5)
+        return EVENT_TYPE_SCORES.get(event_type.lower(), 0.5)
     
     def _categorize_impact(self, impact_score: float) -> str:
         """Categorize impact score"""
@@ -308,18 +502,20 @@ class MLInferenceEngine:
         else:
             return "low"
     
-    def _predict_affected_sectors(self, event_data: Dict[str, Any]) -> List[str]:
+    def _predict_affected_sectors(self, event_data: EventData) -> List[str]:
         """Predict which sectors will be affected"""
-        base_sectors = event_data.get("impact_sectors", [])
+        # Copied so the event's own sector list is left untouched
+        base_sectors = list(event_data.impact_sectors)
         
         # Add related sectors based on event type
-        event_type = event_data.get("event_type", "").lower()
+        event_type = event_data.event_type.lower()
         if event_type == "weather":
             base_sectors.extend(["agriculture", "transportation", "energy"])
         elif event_type == "economic":
             base_sectors.extend(["manufacturing", "retail", "finance"])
         
-        return list(set(base_sectors))
+        # De-duplicated in first-seen order so identical inputs give identical output
+        return list(dict.fromkeys(base_sectors))
     
     def _calculate_region_overlap(self, supply_regions: List[str], event_location: str) -> float:
         """Calculate overlap between supply regions and event location"""
@@ -330,10 +526,12 @@ class MLInferenceEngine:
         overlap_score = 0.0
         
         for region in supply_regions:
-            if region.lower() in event_location_lower or event_location_lower in region.lower():
-                overlap_score = max(overlap_score, 1.0)
-            elif any(word in event_location_lower for word in region.lower().split()):
-                overlap_score = max(overlap_score, 0.5)
+            region_lower = region.lower()
+            if region_lower in event_location_lower or event_location_lower in region_lower:
+                return 1.0  # Nothing scores higher than a full match
+            # Once one region partially matches, later partial matches cannot raise the score
+            if not overlap_score and any(word in event_location_lower for word in region_lower.split()):
+                overlap_score = 0.5
         
         return overlap_score
     
@@ -350,7 +548,7 @@ class MLInferenceEngine:
         
         return 0.0
     
-    def _generate_recommendations(self, risk_level: float, impact_score: float, business_profile: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, risk_level: float, impact_score: float, business_profile: BusinessProfile) -> List[str]:
         """Generate recommendations based on risk and impact"""
         recommendations = []
         
@@ -368,9 +566,102 @@ class MLInferenceEngine:
         
         return recommendations
 
+class PredictionBatcher:
+    """Coalesce concurrent predictions of one type into one cache lookup, model call and cache write"""
+    
+    def __init__(self, prediction_type: str, predict_batch: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]):
+        self.prediction_type = prediction_type
+        self.predict_batch = predict_batch
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task = None
+    
+    def start(self):
+        """Start the batching loop on the running event loop"""
+        self.task = asyncio.create_task(self._run())
+    
+    def stop(self):
+        """Stop the batching loop"""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+    
+    async def predict(self, event_data: EventData, input_hash: str) -> Tuple[Dict[str, Any], bool]:
+        """Queue one event and wait for its share of the next batch, returning (prediction, cached)"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((event_data, input_hash, future))
+        return await future
+    
+    async def _run(self):
+        """Collect queued events until the batch window closes or the batch is full, then predict them together"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + PREDICTION_BATCH_WINDOW
+            while len(batch) < MAX_PREDICTION_BATCH:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                # One MGET for the whole batch; only the misses go to the model
+                input_hashes = [input_hash for _, input_hash, _ in batch]
+                results = await asyncio.to_thread(redis_client.get_cached_ml_predictions, self.prediction_type, input_hashes)
+                misses = [i for i, cached_prediction in enumerate(results) if not cached_prediction]
+                results = [(cached_prediction, True) for cached_prediction in results]
+                if misses:
+                    predictions = self.predict_batch([batch[i][0] for i in misses])
+                    for i, prediction in zip(misses, predictions):
+                        results[i] = (prediction, False)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), result in zip(batch, results):
+                # A caller that gave up has already cancelled its future
+                if not future.done():
+                    future.set_result(result)
+            
+            # New predictions are cached with one pipelined write once the callers have their results
+            if misses:
+                await asyncio.to_thread(
+                    redis_client.cache_ml_predictions,
+                    self.prediction_type,
+                    [(input_hashes[i], results[i][0]) for i in misses]
+                )
+
 # Initialize ML engine
 ml_engine = MLInferenceEngine()
 
+prediction_batchers = {
+    "risk": PredictionBatcher("risk", ml_engine.predict_risk_batch),
+    "impact": PredictionBatcher("impact", ml_engine.predict_impact_batch),
+    "duration": PredictionBatcher("duration", ml_engine.predict_duration_batch)
+}
+
+@app.on_event("startup")
+async def startup_event():
+    """Warm up the models and start the prediction batchers"""
+    # One throwaway prediction per model pays first-call costs before real traffic
+    warmup_event = EventData()
+    ml_engine.predict_risk(warmup_event)
+    ml_engine.predict_impact(warmup_event)
+    ml_engine.predict_duration(warmup_event)
+    
+    for batcher in prediction_batchers.values():
+        batcher.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the prediction batchers"""
+    for batcher in prediction_batchers.values():
+        batcher.stop()
+
 @app.get("/")
 async def root():
     return {"message": "ML Inference Service", "version": "1.0.0"}
@@ -385,54 +676,27 @@ async def health_check():
         "timestamp": datetime.utcnow().isoformat()
     }
 
-@app.post("/predict")
-async def predict(prediction_request: Dict[str, Any]):
-    """Make ML predictions"""
+def store_prediction(prediction_type: str, prediction_request: Dict[str, Any], prediction: Dict[str, Any]):
+    """Record a prediction in the database"""
+    db = SessionLocal()
+    try:
+        ml_prediction = MLPrediction(
+            model_name=prediction_type,
+            input_data=prediction_request,
+            prediction=prediction,
+            confidence_score=prediction.get("confidence", 0.0),
+            model_version="1.0.0"
+        )
+        db.add(ml_prediction)
+        db.commit()
+    except Exception as e:
+        logger.error(f"Error storing prediction: {e}")
+    finally:
+        db.close()
+
+def publish_prediction(prediction_type: str, prediction: Dict[str, Any]):
+    """Publish a prediction event"""
     try:
-        prediction_type = prediction_request.get("type", "risk")
-        event_data = prediction_request.get("event_data", {})
-        
-        # Generate input hash for caching
-        input_str = json.dumps(prediction_request, sort_keys=True)
-        input_hash = hashlib.md5(input_str.encode()).hexdigest()
-        
-        # Check cache first
-        cached_prediction = redis_client.get_cached_ml_prediction(prediction_type, input_hash)
-        if cached_prediction:
-            return {"prediction": cached_prediction, "cached": True}
-        
-        # Make prediction
-        if prediction_type == "risk":
-            prediction = ml_engine.predict_risk(event_data)
-        elif prediction_type == "impact":
-            prediction = ml_engine.predict_impact(event_data)
-        elif prediction_type == "duration":
-            prediction = ml_engine.predict_duration(event_data)
-        elif prediction_type == "business_impact":
-            business_profile = prediction_request.get("business_profile", {})
-            prediction = ml_engine.analyze_business_impact(business_profile, event_data)
-        else:
-            raise HTTPException(status_code=400, detail="Invalid prediction type")
-        
-        # Cache prediction
-        redis_client.cache_ml_prediction(prediction_type, input_hash, prediction)
-        
-        # Store prediction in database
-        db = SessionLocal()
-        try:
-            ml_prediction = MLPrediction(
-                model_name=prediction_type,
-                input_data=prediction_request,
-                prediction=prediction,
-                confidence_score=prediction.get("confidence", 0.0),
-                model_version="1.0.0"
-            )
-            db.add(ml_prediction)
-            db.commit()
-        finally:
-            db.close()
-        
-        # Publish prediction event
         message_queue.publish_event(
             exchange=Exchanges.ML_PREDICTIONS,
             routing_key=EventTypes.ML_PREDICTION,
@@ -442,6 +706,39 @@ async def predict(prediction_request: Dict[str, Any]):
                 "timestamp": datetime.utcnow().isoformat()
             }
         )
+    except Exception as e:
+        logger.error(f"Error publishing prediction: {e}")
+
+@app.post("/predict")
+async def predict(prediction_request: PredictionRequest, background_tasks: BackgroundTasks):
+    """Make ML predictions"""
+    try:
+        prediction_type = prediction_request.type
+        event_data = prediction_request.event_data
+        
+        # Generate input hash for caching from the validated request, so ignored fields do not split the cache
+        input_data = prediction_request.model_dump()
+        input_bytes = orjson.dumps(input_data, option=orjson.OPT_SORT_KEYS)
+        input_hash = hashlib.blake2b(input_bytes, digest_size=16).hexdigest()
+        
+        if prediction_type in prediction_batchers:
+            # Cache lookup, prediction and caching are batched with concurrent requests of the same type
+            prediction, cached = await prediction_batchers[prediction_type].predict(event_data, input_hash)
+        else:
+            # business_impact: check cache first
+            prediction = await asyncio.to_thread(redis_client.get_cached_ml_prediction, prediction_type, input_hash)
+            cached = bool(prediction)
+            
+            if not cached:
+                prediction = ml_engine.analyze_business_impact(prediction_request.business_profile, event_data)
+                background_tasks.add_task(redis_client.cache_ml_prediction, prediction_type, input_hash, prediction)
+        
+        if cached:
+            return {"prediction": prediction, "cached": True}
+        
+        # Store and publish after the response is sent, in the worker threadpool
+        background_tasks.add_task(store_prediction, prediction_type, input_data, prediction)
+        background_tasks.add_task(publish_prediction, prediction_type, prediction)
         
         return {"prediction": prediction, "cached": False}
         
@@ -450,16 +747,11 @@ async def predict(prediction_request: Dict[str, Any]):
         raise HTTPException(status_code=500, detail="Prediction failed")
 
 @app.post("/analyze/business-impact")
-async def analyze_business_impact(analysis_request: Dict[str, Any]):
+async def analyze_business_impact(analysis_request: BusinessImpactRequest):
     """Analyze impact on specific business"""
     try:
-        business_profile = analysis_request.get("business_profile", {})
-        event_data = analysis_request.get("event_data", {})
-        
-        if not business_profile or not event_data:
-            raise HTTPException(status_code=400, detail="Business profile and event data required")
-        
-        analysis = ml_engine.analyze_business_impact(business_profile, event_data)
+        # Both parts are required by the request model, so FastAPI rejects requests missing either
+        analysis = ml_engine.analyze_business_impact(analysis_request.business_profile, analysis_request.event_data)
         
         return {"analysis": analysis}
         
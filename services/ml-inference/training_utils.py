@@ -7,11 +7,11 @@ Includes:
 - Bayesian hyperparameter optimization
 """
 
+import numpy as np
 import pandas as pd
-from typing import List, Tuple, Dict, Any
+from typing import Iterator, List, Tuple, Dict, Any
 from sklearn.model_selection import TimeSeriesSplit
-from imblearn.over_sampling import SMOTE
-from skopt import BayesSearchCV
+from sklearn.neighbors import NearestNeighbors
 from sklearn.ensemble import RandomForestClassifier
 
 # --- Labeled Dataset Creation ---
@@ -23,28 +23,38 @@ def create_labeled_dataset(events: List[Dict[str, Any]]) -> pd.DataFrame:
     return pd.DataFrame(events)
 
 # --- Temporal Cross-Validation ---
-def get_time_series_splits(df: pd.DataFrame, n_splits: int = 5) -> List[Tuple[np.ndarray, np.ndarray]]:
+def get_time_series_splits(df: pd.DataFrame, n_splits: int = 5) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
     """
     Perform temporal cross-validation (TimeSeriesSplit) to avoid leakage.
+    Splits depend only on the row count, so a zero-width placeholder stands in for df,
+    and folds are yielded one at a time.
     """
     tscv = TimeSeriesSplit(n_splits=n_splits)
-    return list(tscv.split(df))
+    yield from tscv.split(np.empty((len(df), 0)))
 
 # --- Class Balancing ---
 def balance_classes(X: pd.DataFrame, y: pd.Series) -> Tuple[pd.DataFrame, pd.Series]:
     """
     Use SMOTE to balance rare disruption classes.
+    The neighbour search (SMOTE's default k=5, plus the sample itself) runs on all cores.
     """
-    smote = SMOTE()
+    # Training-only dependencies are imported on use to keep service start-up light
+    from imblearn.over_sampling import SMOTE
+    
+    smote = SMOTE(k_neighbors=NearestNeighbors(n_neighbors=6, n_jobs=-1))
     X_res, y_res = smote.fit_resample(X, y)
     return X_res, y_res
 
 # --- Bayesian Hyperparameter Optimization ---
-def bayesian_hyperopt(X: pd.DataFrame, y: pd.Series, search_spaces: Dict[str, Any], cv=3) -> Any:
+def bayesian_hyperopt(X: pd.DataFrame, y: pd.Series, search_spaces: Dict[str, Any], cv=3, n_points: int = 4) -> Any:
     """
     Use Bayesian optimization for hyperparameter tuning (example: RandomForest).
+    Each round asks the optimizer for n_points candidates and cross-validates them together,
+    so candidates as well as folds run in parallel.
     """
+    from skopt import BayesSearchCV
+    
     clf = RandomForestClassifier()
-    opt = BayesSearchCV(clf, search_spaces, n_iter=20, cv=cv, n_jobs=-1)
+    opt = BayesSearchCV(clf, search_spaces, n_iter=20, cv=cv, n_jobs=-1, n_points=n_points)
     opt.fit(X, y)
     return opt.best_estimator_, opt.best_params_
@@ -9,7 +9,9 @@ from datetime import datetime, timedelta
 import json
 import sys
 import os
+import uuid
 from typing import Dict, Any, List
+from sqlalchemy import case, func, insert, literal, or_, select
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -57,6 +59,7 @@ class NotificationManager:
         """Process risk assessment and generate alerts if necessary"""
         try:
             risk_assessments = risk_data.get("risk_assessments", [])
+            alerts = []
             
             for assessment in risk_assessments:
                 risk_level = assessment.get("risk_level", 0.0)
@@ -80,13 +83,19 @@ class NotificationManager:
                         }
                     }
                     
-                    # Store alert in database
-                    alert_id = await self._store_alert(alert_data)
-                    
-                    # Send notifications to relevant businesses
-                    await self._notify_affected_businesses(alert_data, assessment)
-                    
-                    logger.info(f"Generated {alert_severity} alert for {assessment.get('region')} {assessment.get('sector')}")
+                    alerts.append((alert_data, assessment))
+            
+            if not alerts:
+                return
+            
+            # Store every alert from this assessment batch in one insert
+            await self._store_alerts([alert_data for alert_data, _ in alerts])
+            
+            for alert_data, assessment in alerts:
+                # Send notifications to relevant businesses
+                await self._notify_affected_businesses(alert_data, assessment)
+                
+                logger.info(f"Generated {alert_data['severity']} alert for {assessment.get('region')} {assessment.get('sector')}")
             
         except Exception as e:
             logger.error(f"Error processing risk alert: {e}")
@@ -128,97 +137,124 @@ class NotificationManager:
     
     async def _store_alert(self, alert_data: Dict[str, Any]) -> str:
         """Store alert in database"""
+        alert_ids = await self._store_alerts([alert_data])
+        return alert_ids[0]
+    
+    async def _store_alerts(self, alerts: List[Dict[str, Any]]) -> List[str]:
+        """Store alerts in database with a single insert"""
+        # The session is synchronous, so the insert runs in a worker thread
+        return await asyncio.to_thread(self._insert_alerts, alerts)
+    
+    def _insert_alerts(self, alerts: List[Dict[str, Any]]) -> List[str]:
+        """Insert alerts in one statement and cache them for real-time access"""
+        # Ids are generated here so the rows need no RETURNING round-trip
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "business_profile_id": alert_data.get("business_profile_id"),
+                "alert_type": alert_data["alert_type"],
+                "title": alert_data["title"],
+                "message": alert_data["message"],
+                "severity": alert_data["severity"],
+                "status": "active",
+                "metadata": alert_data["metadata"]
+            }
+            for alert_data in alerts
+        ]
+        
         db = SessionLocal()
         try:
-            alert = Alert(
-                business_profile_id=alert_data.get("business_profile_id"),
-                alert_type=alert_data["alert_type"],
-                title=alert_data["title"],
-                message=alert_data["message"],
-                severity=alert_data["severity"],
-                status="active",
-                metadata=alert_data["metadata"]
-            )
-            
-            db.add(alert)
+            db.execute(insert(Alert), rows)
             db.commit()
-            db.refresh(alert)
-            
-            # Cache alert for real-time access
-            redis_client.store_real_time_data(
-                "alert",
-                {
-                    "id": str(alert.id),
-                    "title": alert.title,
-                    "severity": alert.severity,
-                    "alert_type": alert.alert_type,
-                    "business_profile_id": str(alert.business_profile_id) if alert.business_profile_id else None
-                }
-            )
-            
-            return str(alert.id)
-            
         except Exception as e:
             db.rollback()
-            logger.error(f"Error storing alert: {e}")
+            logger.error(f"Error storing alerts: {e}")
             raise
         finally:
             db.close()
+        
+        # Cache alerts for real-time access
+        for row in rows:
+            redis_client.store_real_time_data(
+                "alert",
+                {
+                    "id": str(row["id"]),
+                    "title": row["title"],
+                    "severity": row["severity"],
+                    "alert_type": row["alert_type"],
+                    "business_profile_id": str(row["business_profile_id"]) if row["business_profile_id"] else None
+                }
+            )
+        
+        return [str(row["id"]) for row in rows]
     
     async def _notify_affected_businesses(self, alert_data: Dict[str, Any], assessment: Dict[str, Any]):
         """Notify businesses that might be affected by the risk"""
-        db = SessionLocal()
         try:
             region = assessment.get("region", "").lower()
             sector = assessment.get("sector", "").lower()
             
-            # Find businesses that might be affected
-            affected_businesses = db.query(BusinessProfile).all()
+            # Find businesses that might be affected, matched in the database
+            businesses = await asyncio.to_thread(self._load_notification_targets, region=region, sector=sector)
             
-            for business in affected_businesses:
-                # Check if business is affected
-                is_affected = self._is_business_affected(business, region, sector)
+            for business in businesses:
+                business_alert_data = alert_data.copy()
+                business_alert_data["business_profile_id"] = str(business.id)
                 
-                if is_affected:
-                    business_alert_data = alert_data.copy()
-                    business_alert_data["business_profile_id"] = str(business.id)
-                    
-                    await self._send_business_notification(str(business.id), business_alert_data)
+                await self._deliver_notification(business, business_alert_data)
             
         except Exception as e:
             logger.error(f"Error notifying affected businesses: {e}")
+    
+    def _load_notification_targets(self, business_id: str = None, region: str = None, sector: str = None) -> List[Any]:
+        """Load the business columns needed to notify, by id or by affected region and sector"""
+        db = SessionLocal()
+        try:
+            query = select(
+                BusinessProfile.id,
+                BusinessProfile.business_name,
+                BusinessProfile.industry,
+                BusinessProfile.supply_regions,
+                BusinessProfile.notification_preferences
+            )
+            if business_id is not None:
+                query = query.where(BusinessProfile.id == business_id)
+            if region is not None and sector is not None:
+                query = query.where(self._business_affected_clause(region, sector))
+            return db.execute(query).all()
         finally:
             db.close()
     
     async def _send_business_notification(self, business_id: str, alert_data: Dict[str, Any]):
         """Send notification to a specific business"""
-        db = SessionLocal()
         try:
-            business = db.query(BusinessProfile).filter(BusinessProfile.id == business_id).first()
-            if not business:
+            businesses = await asyncio.to_thread(self._load_notification_targets, business_id)
+            if not businesses:
                 return
             
-            notification_preferences = business.notification_preferences or {}
-            
-            # Send notifications based on preferences
-            for channel, enabled in notification_preferences.items():
-                if enabled and channel in self.notification_channels:
-                    try:
-                        await self.notification_channels[channel](business, alert_data)
-                    except Exception as e:
-                        logger.error(f"Error sending {channel} notification to business {business_id}: {e}")
-            
-            # If no preferences set, send email by default
-            if not notification_preferences:
-                try:
-                    await self._send_email_notification(business, alert_data)
-                except Exception as e:
-                    logger.error(f"Error sending default email notification: {e}")
+            await self._deliver_notification(businesses[0], alert_data)
         
         except Exception as e:
             logger.error(f"Error sending business notification: {e}")
-        finally:
-            db.close()
+    
+    async def _deliver_notification(self, business: Any, alert_data: Dict[str, Any]):
+        """Send an alert to a business over its preferred channels"""
+        notification_preferences = business.notification_preferences or {}
+        
+        # Send notifications based on preferences
+        for channel, enabled in notification_preferences.items():
+            if enabled and channel in self.notification_channels:
+                try:
+                    await self.notification_channels[channel](business, alert_data)
+                except Exception as e:
+                    logger.error(f"Error sending {channel} notification to business {business.id}: {e}")
+        
+        # If no preferences set, send email by default
+        if not notification_preferences:
+            try:
+                await self._send_email_notification(business, alert_data)
+            except Exception as e:
+                logger.error(f"Error sending default email notification: {e}")
     
     async def _send_email_notification(self, business: BusinessProfile, alert_data: Dict[str, Any]):
         """Send email notification"""
@@ -326,20 +362,35 @@ class NotificationManager:
         
         return message
     
-    def _is_business_affected(self, business: BusinessProfile, region: str, sector: str) -> bool:
-        """Check if a business is affected by the risk"""
-        # Check supply regions
-        supply_regions = business.supply_regions or []
-        for supply_region in supply_regions:
-            if region in supply_region.lower() or supply_region.lower() in region:
-                return True
-        
-        # Check industry/sector match
-        business_industry = business.industry.lower()
-        if sector in business_industry or business_industry in sector:
-            return True
-        
-        return False
+    def _business_affected_clause(self, region: str, sector: str):
+        """Match businesses whose supply regions or industry overlap a lowercased region and sector"""
+        # A business is affected when a supply region or its industry contains, or is
+        # contained in, the alert's region or sector
+        # Non-array supply_regions are read as empty so one malformed profile cannot fail the query
+        supply_regions = case(
+            (func.jsonb_typeof(BusinessProfile.supply_regions) == "array", BusinessProfile.supply_regions),
+            else_=func.jsonb_build_array()
+        )
+        supply_region = func.jsonb_array_elements_text(supply_regions).table_valued("value").alias("supply_region")
+        region_match = (
+            select(1)
+            .select_from(supply_region)
+            .where(
+                or_(
+                    func.lower(supply_region.c.value).contains(region, autoescape=True),
+                    func.strpos(literal(region), func.lower(supply_region.c.value)) > 0
+                )
+            )
+            .exists()
+        )
+        
+        # The forward industry match can use the lower(industry) trigram index
+        industry_match = or_(
+            func.lower(BusinessProfile.industry).contains(sector, autoescape=True),
+            func.strpos(literal(sector), func.lower(BusinessProfile.industry)) > 0
+        )
+        
+        return or_(region_match, industry_match)
 
 # Initialize notification manager
 notification_manager = NotificationManager()
@@ -5,7 +5,7 @@ Shared Redis client for caching and real-time data
 import redis
 import json
 import logging
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List, Tuple
 import os
 from datetime import datetime, timedelta
 
@@ -27,6 +27,58 @@ class RedisClient:
             logger.error(f"Failed to set key {key}: {e}")
             return False
     
+    def set_many(self, entries: List[Tuple[str, Any, Optional[int]]],
+                 stream_entries: Optional[List[Tuple[str, Any]]] = None,
+                 stream_maxlen: int = 10000) -> bool:
+        """Set several (key, value, ttl) entries in a single pipelined round-trip
+        
+        Values that are already JSON-encoded bytes are stored without re-encoding.
+        Optional (stream, value) pairs are appended with XADD in the same round-trip,
+        with each stream capped at roughly stream_maxlen entries.
+        """
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value, ttl in entries:
+                serialized_value = value if isinstance(value, bytes) else json.dumps(value, default=str)
+                pipe.setex(key, ttl or self.default_ttl, serialized_value)
+            for stream, value in stream_entries or ():
+                serialized_value = value if isinstance(value, bytes) else json.dumps(value, default=str)
+                pipe.xadd(stream, {"data": serialized_value}, maxlen=stream_maxlen, approximate=True)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set {len(entries)} keys: {e}")
+            return False
+    
+    def push_capped(self, key: str, values: List[Any], max_length: int, ttl: Optional[int] = None) -> bool:
+        """Prepend values to a list kept to its newest max_length items, in one round-trip
+        
+        The last value ends up at the head of the list.
+        """
+        if not values:
+            return True
+        try:
+            serialized_values = [value if isinstance(value, bytes) else json.dumps(value, default=str) for value in values]
+            pipe = self.client.pipeline(transaction=False)
+            pipe.lpush(key, *serialized_values)
+            pipe.ltrim(key, 0, max_length - 1)
+            pipe.expire(key, ttl or self.default_ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to push to list {key}: {e}")
+            return False
+    
+    def get_list(self, key: str, count: int) -> List[Any]:
+        """Get the first count items of a list"""
+        if count <= 0:
+            return []
+        try:
+            return [json.loads(value) for value in self.client.lrange(key, 0, count - 1)]
+        except Exception as e:
+            logger.error(f"Failed to get list {key}: {e}")
+            return []
+    
     def get(self, key: str) -> Optional[Any]:
         """Get a value from Redis"""
         try:
@@ -38,6 +90,32 @@ class RedisClient:
             logger.error(f"Failed to get key {key}: {e}")
             return None
     
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in a single MGET round-trip, with None for missing keys"""
+        if not keys:
+            return []
+        try:
+            return [json.loads(value) if value else None for value in self.client.mget(keys)]
+        except Exception as e:
+            logger.error(f"Failed to get {len(keys)} keys: {e}")
+            return [None] * len(keys)
+    
+    def acquire_lock(self, key: str, ttl: int) -> bool:
+        """Take a short-lived lock key; returns False if another holder has it"""
+        try:
+            return bool(self.client.set(key, "1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Failed to acquire lock {key}: {e}")
+            return False
+    
+    def get_raw(self, key: str) -> Optional[str]:
+        """Get a stored value without JSON-decoding it"""
+        try:
+            return self.client.get(key)
+        except Exception as e:
+            logger.error(f"Failed to get key {key}: {e}")
+            return None
+    
     def delete(self, key: str) -> bool:
         """Delete a key from Redis"""
         try:
@@ -98,6 +176,17 @@ class RedisClient:
         key = f"ml_prediction:{model_name}:{input_hash}"
         return self.get(key)
     
+    def cache_ml_predictions(self, model_name: str, predictions: List[Tuple[str, Dict[str, Any]]], ttl: int = 3600):
+        """Cache several (input_hash, prediction) pairs in one round-trip (1 hour TTL)"""
+        return self.set_many([
+            (f"ml_prediction:{model_name}:{input_hash}", prediction, ttl)
+            for input_hash, prediction in predictions
+        ])
+    
+    def get_cached_ml_predictions(self, model_name: str, input_hashes: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Get several cached ML predictions in one round-trip"""
+        return self.get_many([f"ml_prediction:{model_name}:{input_hash}" for input_hash in input_hashes])
+    
     def store_real_time_data(self, data_type: str, data: Dict[str, Any], ttl: int = 300):
         """Store real-time data (5 minutes TTL)"""
         timestamp = datetime.utcnow().isoformat()
@@ -146,3 +235,4 @@ class CacheKeys:
     REAL_TIME_DATA = "realtime:{type}:{timestamp}"
     BUSINESS_PROFILE = "business_profile:{id}"
     RECENT_EVENTS = "recent_events:{hours}"
+    EVENT_STREAM = "events:{source}"